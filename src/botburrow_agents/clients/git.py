@@ -42,6 +42,9 @@ DEFAULT_GITHUB_BRANCH = "main"
 # GitHub raw URL pattern
 GITHUB_RAW_URL = "https://raw.githubusercontent.com"
 
+# Bytes read when only a skill's frontmatter is needed
+SKILL_HEAD_BYTES = 4096
+
 
 class GitClient:
     """Client for loading agent configs from git.
@@ -95,6 +98,20 @@ class GitClient:
         response.raise_for_status()
         return response.text
 
+    async def _fetch_bytes_from_github(self, url: str) -> bytes:
+        """Fetch raw, undecoded content from GitHub raw URL."""
+        client = self._get_http_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+
+    async def _fetch_head_from_github(self, url: str, max_bytes: int) -> bytes:
+        """Fetch up to max_bytes from the start of a GitHub raw URL."""
+        client = self._get_http_client()
+        response = await client.get(url, headers={"Range": f"bytes=0-{max_bytes - 1}"})
+        response.raise_for_status()
+        return response.content[:max_bytes]
+
     async def get_agent_config(self, agent_id: str) -> dict[str, Any]:
         """Get agent config YAML.
 
@@ -146,6 +163,29 @@ class GitClient:
                     return ""
                 raise
 
+    async def _read_skill(self, skill_name: str, max_bytes: int | None = None) -> bytes:
+        """Read a skill's SKILL.md, or only its first max_bytes, undecoded.
+
+        Raises:
+            FileNotFoundError: If skill not found
+        """
+        if self.use_local:
+            path = Path(self.local_path) / "skills" / skill_name / "SKILL.md"
+            if not path.exists():
+                raise FileNotFoundError(f"Skill not found: {skill_name}")
+            with path.open("rb") as f:
+                return f.read() if max_bytes is None else f.read(max_bytes)
+
+        url = f"{GITHUB_RAW_URL}/{self.repo}/{self.branch}/skills/{skill_name}/SKILL.md"
+        try:
+            if max_bytes is None:
+                return await self._fetch_bytes_from_github(url)
+            return await self._fetch_head_from_github(url, max_bytes)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise FileNotFoundError(f"Skill not found: {skill_name}") from e
+            raise
+
     async def get_skill(self, skill_name: str) -> str:
         """Get skill instructions.
 
@@ -158,19 +198,44 @@ class GitClient:
         Raises:
             FileNotFoundError: If skill not found
         """
-        if self.use_local:
-            path = Path(self.local_path) / "skills" / skill_name / "SKILL.md"
-            if not path.exists():
-                raise FileNotFoundError(f"Skill not found: {skill_name}")
-            return path.read_text()
-        else:
-            url = f"{GITHUB_RAW_URL}/{self.repo}/{self.branch}/skills/{skill_name}/SKILL.md"
-            try:
-                return await self._fetch_from_github(url)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise FileNotFoundError(f"Skill not found: {skill_name}") from e
-                raise
+        return (await self.get_skill_bytes(skill_name)).decode("utf-8")
+
+    async def get_skill_bytes(self, skill_name: str) -> bytes:
+        """Get skill instructions as raw UTF-8 bytes.
+
+        Lets callers hash or cache the file before paying for a decode.
+
+        Args:
+            skill_name: Name of the skill
+
+        Returns:
+            SKILL.md contents, undecoded
+
+        Raises:
+            FileNotFoundError: If skill not found
+        """
+        return await self._read_skill(skill_name)
+
+    async def get_skill_head(self, skill_name: str, max_bytes: int = SKILL_HEAD_BYTES) -> str:
+        """Get the leading lines of a skill, enough for its frontmatter.
+
+        Reads at most max_bytes. When the file is longer, the trailing
+        partial line is dropped so a cut never lands inside a delimiter.
+
+        Args:
+            skill_name: Name of the skill
+            max_bytes: Maximum number of bytes to read
+
+        Returns:
+            Start of the SKILL.md contents
+
+        Raises:
+            FileNotFoundError: If skill not found
+        """
+        data = await self._read_skill(skill_name, max_bytes)
+        if len(data) >= max_bytes:
+            data = data[: data.rfind(b"\n") + 1]
+        return data.decode("utf-8", errors="replace")
 
     async def list_agents(self) -> list[str]:
         """List available agent IDs.
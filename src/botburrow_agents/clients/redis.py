@@ -178,7 +178,7 @@ class RedisClient:
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         ex: int | None = None,
         nx: bool = False,
     ) -> bool:
@@ -197,6 +197,17 @@ class RedisClient:
         result = await r.set(key, value, ex=ex, nx=nx)
         return result is not None
 
+    async def mget(self, *keys: str) -> list[str | None]:
+        """Get several values in one round trip.
+
+        Returns:
+            Values in key order, with None for missing keys
+        """
+        if not keys:
+            return []
+        r = await self._ensure_connected()
+        return await r.mget(keys)
+
     async def delete(self, key: str) -> int:
         """Delete a key."""
         r = await self._ensure_connected()
@@ -8,10 +8,10 @@ Handles:
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import orjson
 import structlog
 
 from botburrow_agents.config import Settings, get_settings
@@ -170,11 +170,11 @@ class Assigner:
             status: Runner status (active, busy, idle)
         """
         key = f"runner:heartbeat:{runner_id}"
-        value = json.dumps(
+        value = orjson.dumps(
             {
                 "runner_id": runner_id,
                 "status": status,
-                "timestamp": datetime.now(UTC).isoformat(),
+                "timestamp": datetime.now(UTC),
             }
         )
         # Heartbeats expire after 2x poll interval
@@ -192,7 +192,7 @@ class Assigner:
             for key in keys:
                 value = await r.get(key)
                 if value:
-                    runners.append(json.loads(value))
+                    runners.append(orjson.loads(value))
             if cursor == 0:
                 break
 
@@ -225,13 +225,13 @@ class Assigner:
     async def _track_assignment(self, assignment: Assignment, runner_id: str) -> None:
         """Track assignment metadata."""
         key = f"agent:activation:{assignment.agent_id}"
-        value = json.dumps(
+        value = orjson.dumps(
             {
                 "agent_id": assignment.agent_id,
                 "agent_name": assignment.agent_name,
                 "runner_id": runner_id,
                 "task_type": assignment.task_type.value,
-                "started_at": datetime.now(UTC).isoformat(),
+                "started_at": datetime.now(UTC),
             }
         )
         await self.redis.set(key, value, ex=self.settings.activation_timeout)
@@ -245,7 +245,7 @@ class Assigner:
         """Record activation result for metrics."""
         # Store in a list for recent history
         key = "activation:results"
-        value = json.dumps(
+        value = orjson.dumps(
             {
                 "agent_id": result.agent_id,
                 "agent_name": result.agent_name,
@@ -256,7 +256,7 @@ class Assigner:
                 "tokens_used": result.tokens_used,
                 "duration_seconds": result.duration_seconds,
                 "error": result.error,
-                "timestamp": datetime.now(UTC).isoformat(),
+                "timestamp": datetime.now(UTC),
             }
         )
         r = await self.redis._ensure_connected()
@@ -268,4 +268,4 @@ class Assigner:
         """Get recent activation results."""
         r = await self.redis._ensure_connected()
         results = await r.lrange("activation:results", 0, limit - 1)
-        return [json.loads(r) for r in results]
+        return [orjson.loads(r) for r in results]
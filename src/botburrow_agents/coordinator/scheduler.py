@@ -7,7 +7,8 @@ Implements staleness-based scheduling per ADR-011:
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import structlog
@@ -21,6 +22,11 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Exploration scores are whole epoch seconds; aware datetimes are converted
+# with plain timedelta arithmetic instead of datetime.timestamp()
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_SECOND = timedelta(seconds=1)
+
 
 class Scheduler:
     """Determines which agents should be activated next.
@@ -65,10 +71,11 @@ class Scheduler:
     async def _get_notification_assignment(self) -> Assignment | None:
         """Get an agent with pending notifications."""
         agents = await self.hub.get_agents_with_notifications()
+        locked = await self._locked_flags(agents)
 
-        for agent in agents:
-            # Check if agent is already locked
-            if await self._is_locked(agent.agent_id):
+        for agent, is_locked in zip(agents, locked, strict=True):
+            # Skip agents already locked by a runner
+            if is_locked:
                 continue
 
             logger.debug(
@@ -85,10 +92,11 @@ class Scheduler:
         agents = await self.hub.get_stale_agents(
             min_staleness_seconds=self.settings.min_activation_interval
         )
+        locked = await self._locked_flags(agents)
 
-        for agent in agents:
-            # Check if agent is already locked
-            if await self._is_locked(agent.agent_id):
+        for agent, is_locked in zip(agents, locked, strict=True):
+            # Skip agents already locked by a runner
+            if is_locked:
                 continue
 
             # Check if agent has exceeded daily limits
@@ -104,10 +112,17 @@ class Scheduler:
 
         return None
 
-    async def _is_locked(self, agent_id: str) -> bool:
-        """Check if an agent is currently locked by a runner."""
-        lock_key = f"agent_lock:{agent_id}"
-        return await self.redis.exists(lock_key)
+    async def _locked_flags(self, agents: list[Assignment]) -> list[bool]:
+        """Check which agents are currently locked by a runner.
+
+        Probes all lock keys with a single MGET instead of one EXISTS
+        round trip per candidate.
+
+        Returns:
+            One flag per agent, in the same order
+        """
+        owners = await self.redis.mget(*(f"agent_lock:{agent.agent_id}" for agent in agents))
+        return [owner is not None for owner in owners]
 
     async def _check_daily_limits(self, agent_id: str) -> bool:
         """Check if agent has exceeded daily activity limits.
@@ -127,16 +142,14 @@ class Scheduler:
 
     async def get_queue_stats(self) -> dict[str, int]:
         """Get current queue statistics."""
-        notification_agents = await self.hub.get_agents_with_notifications()
-        stale_agents = await self.hub.get_stale_agents(
-            min_staleness_seconds=self.settings.min_activation_interval
+        # Both Hub queries are independent, so overlap them
+        notification_agents, stale_agents = await asyncio.gather(
+            self.hub.get_agents_with_notifications(),
+            self.hub.get_stale_agents(min_staleness_seconds=self.settings.min_activation_interval),
         )
 
         # Count locked agents
-        locked_count = 0
-        for agent in notification_agents + stale_agents:
-            if await self._is_locked(agent.agent_id):
-                locked_count += 1
+        locked_count = sum(await self._locked_flags(notification_agents + stale_agents))
 
         return {
             "notification_queue": len(notification_agents),
@@ -158,6 +171,7 @@ class PriorityQueue:
 
     NOTIFICATION_QUEUE = "queue:notifications"
     EXPLORATION_QUEUE = "queue:exploration"
+    LOCK_PREFIX = "agent_lock:"
 
     def __init__(self, redis: RedisClient) -> None:
         self.redis = redis
@@ -173,7 +187,13 @@ class PriorityQueue:
         """Add agent to exploration queue with priority based on staleness."""
         r = await self.redis._ensure_connected()
         # Older = higher priority (lower score)
-        score: float = 0 if last_activated is None else last_activated.timestamp()
+        score: int
+        if last_activated is None:
+            score = 0
+        elif last_activated.tzinfo is None:
+            score = int(last_activated.timestamp())
+        else:
+            score = (last_activated - _EPOCH) // _ONE_SECOND
         await r.zadd(self.EXPLORATION_QUEUE, {agent_id: score})
 
     async def pop_notification(self) -> str | None:
@@ -195,12 +215,17 @@ class PriorityQueue:
     async def remove(self, agent_id: str) -> None:
         """Remove agent from all queues."""
         r = await self.redis._ensure_connected()
-        await r.zrem(self.NOTIFICATION_QUEUE, agent_id)
-        await r.zrem(self.EXPLORATION_QUEUE, agent_id)
+        pipe = r.pipeline(transaction=False)
+        pipe.zrem(self.NOTIFICATION_QUEUE, agent_id)
+        pipe.zrem(self.EXPLORATION_QUEUE, agent_id)
+        await pipe.execute()
 
     async def get_queue_lengths(self) -> tuple[int, int]:
         """Get lengths of both queues."""
         r = await self.redis._ensure_connected()
-        notif_len = await r.zcard(self.NOTIFICATION_QUEUE)
-        explore_len = await r.zcard(self.EXPLORATION_QUEUE)
+        # Both ZCARDs in one round trip
+        pipe = r.pipeline(transaction=False)
+        pipe.zcard(self.NOTIFICATION_QUEUE)
+        pipe.zcard(self.EXPLORATION_QUEUE)
+        notif_len, explore_len = await pipe.execute()
         return notif_len, explore_len
@@ -9,12 +9,13 @@ Implements Redis-based work queue with:
 
 from __future__ import annotations
 
-import json
 import random
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 
 from botburrow_agents.config import Settings, get_settings
@@ -34,8 +35,54 @@ ACTIVE_TASKS = "work:active"  # Hash: agent_id -> runner_id
 AGENT_FAILURES = "work:failures"  # Hash: agent_id -> failure count
 AGENT_BACKOFF = "work:backoff"  # Hash: agent_id -> backoff_until timestamp
 
+# Enqueue script results
+ENQUEUED = 1
+SKIPPED_DUPLICATE = 0
+SKIPPED_BACKOFF = -1
+
+# Dedup check, backoff check (clearing an expired backoff) and LPUSH in one
+# server-side call.
+# KEYS: active tasks hash, backoff hash, target queue
+# ARGV: agent_id, now, work JSON, force ("1" skips both checks)
+ENQUEUE_LUA = """
+if ARGV[4] ~= '1' then
+    if redis.call('HGET', KEYS[1], ARGV[1]) then
+        return 0
+    end
+    local backoff_until = redis.call('HGET', KEYS[2], ARGV[1])
+    if backoff_until then
+        if tonumber(backoff_until) > tonumber(ARGV[2]) then
+            return -1
+        end
+        redis.call('HDEL', KEYS[2], ARGV[1])
+    end
+end
+redis.call('LPUSH', KEYS[3], ARGV[3])
+return 1
+"""
+
+
+# Leader election results
+LEADER_ACQUIRED = 2
+LEADER_REFRESHED = 1
+LEADER_LOST = 0
+
+# Claim leadership if free, or refresh the TTL if we already hold it.
+# KEYS: leader key
+# ARGV: instance_id, TTL seconds
+LEADER_LUA = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return 2
+end
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkItem:
     """Work item in the queue."""
 
@@ -46,23 +93,18 @@ class WorkItem:
     inbox_count: int = 0
     created_at: float = field(default_factory=time.time)
 
-    def to_json(self) -> str:
-        """Serialize to JSON."""
-        return json.dumps(
-            {
-                "agent_id": self.agent_id,
-                "agent_name": self.agent_name,
-                "task_type": self.task_type.value,
-                "priority": self.priority,
-                "inbox_count": self.inbox_count,
-                "created_at": self.created_at,
-            }
-        )
+    def to_json(self) -> bytes:
+        """Serialize to JSON (UTF-8 bytes, ready to store in Redis).
+
+        orjson encodes the slotted dataclass and the StrEnum natively, so
+        no intermediate dict is built.
+        """
+        return orjson.dumps(self)
 
     @classmethod
-    def from_json(cls, data: str) -> WorkItem:
+    def from_json(cls, data: str | bytes) -> WorkItem:
         """Deserialize from JSON."""
-        d = json.loads(data)
+        d = orjson.loads(data)
         return cls(
             agent_id=d["agent_id"],
             agent_name=d["agent_name"],
@@ -96,6 +138,9 @@ class WorkQueue:
         self.backoff_base = 60  # seconds
         self.backoff_max = 3600  # 1 hour max
 
+        # Registered lazily on first enqueue (EVALSHA with EVAL fallback)
+        self._enqueue_script: Any = None
+
     async def enqueue(
         self,
         work: WorkItem,
@@ -111,29 +156,25 @@ class WorkQueue:
             True if enqueued, False if duplicate
         """
         r = await self.redis._ensure_connected()
-
-        # Check for deduplication (unless forced)
-        if not force:
-            # Check if agent already has active task
-            active = await r.hget(ACTIVE_TASKS, work.agent_id)
-            if active:
-                logger.debug("duplicate_work_skipped", agent_id=work.agent_id)
-                return False
-
-            # Check if agent is in backoff
-            backoff_until = await r.hget(AGENT_BACKOFF, work.agent_id)
-            if backoff_until:
-                if float(backoff_until) > time.time():
-                    logger.debug("agent_in_backoff", agent_id=work.agent_id)
-                    return False
-                # Backoff expired, clear it
-                await r.hdel(AGENT_BACKOFF, work.agent_id)
+        if self._enqueue_script is None:
+            self._enqueue_script = r.register_script(ENQUEUE_LUA)
 
         # Choose queue by priority
         queue_key = self._get_queue_key(work.priority)
 
-        # Add to queue
-        await r.lpush(queue_key, work.to_json())
+        # Dedup and backoff checks (unless forced) run atomically with the push
+        result = await self._enqueue_script(
+            keys=[ACTIVE_TASKS, AGENT_BACKOFF, queue_key],
+            args=[work.agent_id, time.time(), work.to_json(), int(force)],
+            client=r,
+        )
+
+        if result == SKIPPED_DUPLICATE:
+            logger.debug("duplicate_work_skipped", agent_id=work.agent_id)
+            return False
+        if result == SKIPPED_BACKOFF:
+            logger.debug("agent_in_backoff", agent_id=work.agent_id)
+            return False
 
         logger.debug(
             "work_enqueued",
@@ -198,16 +239,18 @@ class WorkQueue:
         """
         r = await self.redis._ensure_connected()
 
-        # Remove from active tasks
-        await r.hdel(ACTIVE_TASKS, work.agent_id)
-
+        # Release the task and update failure state in one round-trip
+        pipe = r.pipeline(transaction=False)
+        pipe.hdel(ACTIVE_TASKS, work.agent_id)
         if success:
             # Clear failure count on success
-            await r.hdel(AGENT_FAILURES, work.agent_id)
-            await r.hdel(AGENT_BACKOFF, work.agent_id)
+            pipe.hdel(AGENT_FAILURES, work.agent_id)
+            pipe.hdel(AGENT_BACKOFF, work.agent_id)
+            await pipe.execute()
         else:
             # Increment failure count
-            failures = await r.hincrby(AGENT_FAILURES, work.agent_id, 1)
+            pipe.hincrby(AGENT_FAILURES, work.agent_id, 1)
+            _, failures = await pipe.execute()
 
             if failures >= self.max_failures:
                 # Enter circuit breaker backoff
@@ -235,11 +278,13 @@ class WorkQueue:
         """Get queue statistics."""
         r = await self.redis._ensure_connected()
 
-        high_len = await r.llen(QUEUE_HIGH)
-        normal_len = await r.llen(QUEUE_NORMAL)
-        low_len = await r.llen(QUEUE_LOW)
-        active = await r.hlen(ACTIVE_TASKS)
-        backoff = await r.hlen(AGENT_BACKOFF)
+        pipe = r.pipeline(transaction=False)
+        pipe.llen(QUEUE_HIGH)
+        pipe.llen(QUEUE_NORMAL)
+        pipe.llen(QUEUE_LOW)
+        pipe.hlen(ACTIVE_TASKS)
+        pipe.hlen(AGENT_BACKOFF)
+        high_len, normal_len, low_len, active, backoff = await pipe.execute()
 
         return {
             "queue_high": high_len,
@@ -277,6 +322,11 @@ class ConfigCache:
 
     CACHE_PREFIX = "cache:agent:"
     DEFAULT_TTL = 300  # 5 minutes
+    # In-process copy in front of Redis. Kept short because invalidations
+    # from other processes only reach Redis, so a local entry may be stale
+    # for up to LOCAL_TTL seconds.
+    LOCAL_TTL = 30.0
+    LOCAL_SIZE = 1024
 
     def __init__(
         self,
@@ -285,14 +335,35 @@ class ConfigCache:
     ) -> None:
         self.redis = redis
         self.ttl = ttl
+        # agent_id -> (monotonic expiry, serialized config)
+        self._local: OrderedDict[str, tuple[float, bytes | str]] = OrderedDict()
+
+    def _remember(self, agent_id: str, data: bytes | str, ttl: float) -> None:
+        """Store serialized config in the local LRU."""
+        self._local[agent_id] = (time.monotonic() + min(ttl, self.LOCAL_TTL), data)
+        self._local.move_to_end(agent_id)
+        if len(self._local) > self.LOCAL_SIZE:
+            self._local.popitem(last=False)
 
     async def get(self, agent_id: str) -> dict[str, Any] | None:
-        """Get cached agent config."""
+        """Get cached agent config.
+
+        Served from the local LRU when fresh, otherwise from Redis.
+        """
+        entry = self._local.get(agent_id)
+        if entry is not None:
+            expires_at, cached = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(agent_id)
+                return orjson.loads(cached)
+            del self._local[agent_id]
+
         r = await self.redis._ensure_connected()
         key = f"{self.CACHE_PREFIX}{agent_id}"
         data = await r.get(key)
         if data:
-            return json.loads(data)
+            self._remember(agent_id, data, self.ttl)
+            return orjson.loads(data)
         return None
 
     async def set(
@@ -311,16 +382,20 @@ class ConfigCache:
         r = await self.redis._ensure_connected()
         key = f"{self.CACHE_PREFIX}{agent_id}"
         cache_ttl = ttl or config.get("cache_ttl", self.ttl)
-        await r.set(key, json.dumps(config), ex=cache_ttl)
+        data = orjson.dumps(config)
+        await r.set(key, data, ex=cache_ttl)
+        self._remember(agent_id, data, cache_ttl)
 
     async def invalidate(self, agent_id: str) -> None:
         """Invalidate cached config."""
+        self._local.pop(agent_id, None)
         r = await self.redis._ensure_connected()
         key = f"{self.CACHE_PREFIX}{agent_id}"
         await r.delete(key)
 
     async def invalidate_all(self) -> None:
         """Invalidate all cached configs (for webhook endpoint)."""
+        self._local.clear()
         r = await self.redis._ensure_connected()
         # Find all keys with the cache prefix
         pattern = f"{self.CACHE_PREFIX}*"
@@ -385,6 +460,8 @@ class LeaderElection:
         self.redis = redis
         self.instance_id = instance_id
         self._is_leader = False
+        # Registered lazily on first election attempt
+        self._acquire_script: Any = None
 
     async def try_become_leader(self) -> bool:
         """Try to become leader.
@@ -393,30 +470,23 @@ class LeaderElection:
             True if this instance is now leader
         """
         r = await self.redis._ensure_connected()
-
-        # Try to claim leadership
-        acquired = await r.set(
-            self.LEADER_KEY,
-            self.instance_id,
-            nx=True,
-            ex=self.HEARTBEAT_TTL,
+        if self._acquire_script is None:
+            self._acquire_script = r.register_script(LEADER_LUA)
+
+        # Claim leadership, or refresh it if we already hold it
+        result = await self._acquire_script(
+            keys=[self.LEADER_KEY],
+            args=[self.instance_id, self.HEARTBEAT_TTL],
+            client=r,
         )
 
-        if acquired:
+        if result == LEADER_ACQUIRED:
             self._is_leader = True
             logger.info("became_leader", instance_id=self.instance_id)
             return True
 
-        # Check if we're already leader
-        current = await r.get(self.LEADER_KEY)
-        if current == self.instance_id:
-            # Refresh our leadership
-            await r.expire(self.LEADER_KEY, self.HEARTBEAT_TTL)
-            self._is_leader = True
-            return True
-
-        self._is_leader = False
-        return False
+        self._is_leader = result == LEADER_REFRESHED
+        return self._is_leader
 
     async def release_leadership(self) -> None:
         """Release leadership."""
@@ -448,4 +518,4 @@ def jitter(base: float, factor: float = 0.1) -> float:
 
     Helps avoid thundering herd.
     """
-    return base * (1 + random.uniform(-factor, factor))
+    return base * (1.0 + factor * (2.0 * random.random() - 1.0))
@@ -30,9 +30,15 @@ from botburrow_agents.config import Settings, get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Use the C (libyaml) safe loader for frontmatter, falling back to pure Python
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Type alias for stats dict
 StatsDict = dict[str, Any]
 
+# Integer counters in a StatsDict (alongside its "errors" list)
+_STAT_COUNTERS = ("fetched", "validated", "uploaded", "skipped", "failed")
+
 
 # Default ClawHub repositories to sync from
 DEFAULT_SKILL_SOURCES = [
@@ -41,6 +47,9 @@ DEFAULT_SKILL_SOURCES = [
     "botburrow/community-skills",
 ]
 
+# Upper bound on sources fetched concurrently (GitHub API rate limits)
+MAX_CONCURRENT_SOURCES = 4
+
 # Skill security validation rules
 MAX_SKILL_SIZE_BYTES = 1024 * 100  # 100KB max per skill
 ALLOWED_SKILL_EXTENSIONS = {".py", ".yaml", ".yml", ".md"}
@@ -53,6 +62,9 @@ BLOCKED_PATTERNS = [
     "os.popen",
 ]
 
+# Lowercased once at import; matched against lowercased skill content
+_BLOCKED_PATTERNS_LOWER: tuple[str, ...] = tuple(p.lower() for p in BLOCKED_PATTERNS)
+
 
 class SkillSync:
     """Syncs skills from ClawHub to R2."""
@@ -103,30 +115,35 @@ class SkillSync:
             Dict with sync statistics
         """
         start_time = time.time()
-        stats: StatsDict = {
-            "fetched": 0,
-            "validated": 0,
-            "uploaded": 0,
-            "skipped": 0,
-            "failed": 0,
-            "errors": [],
-        }
+        errors: list[str] = []
+        stats: StatsDict = dict.fromkeys(_STAT_COUNTERS, 0)
+        stats["errors"] = errors
 
         logger.info("skill_sync_starting", sources=self.sources)
 
-        for source in self.sources:
-            try:
-                source_stats = await self._sync_source(source)
-                stats["fetched"] += cast(int, source_stats.get("fetched", 0))
-                stats["validated"] += cast(int, source_stats.get("validated", 0))
-                stats["uploaded"] += cast(int, source_stats.get("uploaded", 0))
-                stats["skipped"] += cast(int, source_stats.get("skipped", 0))
-                stats["failed"] += cast(int, source_stats.get("failed", 0))
-                cast(list, stats["errors"]).extend(cast(list, source_stats.get("errors", [])))
-            except Exception as e:
-                logger.error("source_sync_failed", source=source, error=str(e))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+
+        async def sync_bounded(source: str) -> StatsDict:
+            async with semaphore:
+                return await self._sync_source(source)
+
+        # Sources are independent, so fetch them concurrently
+        results = await asyncio.gather(
+            *(sync_bounded(source) for source in self.sources),
+            return_exceptions=True,
+        )
+
+        for source, result in zip(self.sources, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error("source_sync_failed", source=source, error=str(result))
                 stats["failed"] += 1
-                cast(list, stats["errors"]).append(f"{source}: {str(e)}")
+                errors.append(f"{source}: {str(result)}")
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for key in _STAT_COUNTERS:
+                stats[key] += result.get(key, 0)
+            errors.extend(result.get("errors", ()))
 
         duration = time.time() - start_time
         logger.info(
@@ -190,7 +207,7 @@ class SkillSync:
                     content = base64.b64decode(file_data["content"]).decode("utf-8")
 
                     # Validate skill
-                    if not await self._validate_skill(filename, content):
+                    if not self._validate_skill(filename, content):
                         cast(dict, stats)["skipped"] += 1
                         continue
 
@@ -216,7 +233,7 @@ class SkillSync:
 
         return stats
 
-    async def _validate_skill(self, filename: str, content: str) -> bool:
+    def _validate_skill(self, filename: str, content: str) -> bool:
         """Validate a skill for security and format.
 
         Args:
@@ -226,15 +243,20 @@ class SkillSync:
         Returns:
             True if valid, False otherwise
         """
-        # Check size
-        if len(content.encode("utf-8")) > MAX_SKILL_SIZE_BYTES:
+        # Check size before any scanning. A UTF-8 encoding is never shorter
+        # than the character count, and for ASCII they are equal, so only
+        # non-ASCII content within the limit needs encoding to measure.
+        if len(content) > MAX_SKILL_SIZE_BYTES or (
+            not content.isascii() and len(content.encode("utf-8")) > MAX_SKILL_SIZE_BYTES
+        ):
             logger.warning("skill_too_large", filename=filename, size=len(content))
             return False
 
-        # Check for blocked patterns (security)
+        # Check for blocked patterns (security). Plain substring tests on the
+        # lowercased content beat a case-insensitive regex alternation here.
         content_lower = content.lower()
-        for pattern in BLOCKED_PATTERNS:
-            if pattern.lower() in content_lower:
+        for pattern in _BLOCKED_PATTERNS_LOWER:
+            if pattern in content_lower:
                 logger.warning("skill_blocked_pattern", filename=filename, pattern=pattern)
                 return False
 
@@ -269,7 +291,7 @@ class SkillSync:
             parts = content.split("---", 2)
             if len(parts) >= 3:
                 try:
-                    frontmatter = yaml.safe_load(parts[1])
+                    frontmatter = yaml.load(parts[1], Loader=_YAML_LOADER)
                     if isinstance(frontmatter, dict):
                         meta.update(
                             {
@@ -6,11 +6,12 @@ https://github.com/ardenone/agent-definitions/blob/main/schemas/agent-config.sch
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # Agent Configuration Models
 
@@ -158,6 +159,26 @@ class AgentConfig(BaseModel):
     r2_path: str = ""  # Deprecated: kept for backwards compatibility
     cache_ttl: int = 300  # Seconds to cache config (default 5 min)
 
+    # (grants it was built from, exact grants, services with any grant)
+    _compiled_grants: tuple[tuple[str, ...], frozenset[str], frozenset[str]] | None = PrivateAttr(
+        default=None
+    )
+
+    @property
+    def compiled_grants(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Grants as (exact grants, services with at least one grant).
+
+        Rebuilt only when the grants list has changed since the last call,
+        including in-place mutation of capabilities.grants.
+        """
+        key = tuple(self.capabilities.grants)
+        compiled = self._compiled_grants
+        if compiled is None or compiled[0] != key:
+            exact = frozenset(key)
+            services = frozenset(g.split(":", 1)[0] for g in exact if ":" in g)
+            compiled = self._compiled_grants = (key, exact, services)
+        return compiled[1], compiled[2]
+
     def is_expired(self) -> bool:
         """Check if cached config is expired based on cache_ttl."""
         # This is checked by cache layer, not on the model
@@ -199,8 +220,13 @@ class TaskType(StrEnum):
     DISCOVERY = "discovery"  # Explore and engage
 
 
-class Assignment(BaseModel):
-    """Work assignment from coordinator to runner."""
+@dataclass(slots=True, frozen=True)
+class Assignment:
+    """Work assignment from coordinator to runner.
+
+    A plain slotted dataclass rather than a pydantic model: one is built per
+    scheduling candidate and it is never validated or serialized.
+    """
 
     agent_id: str
     agent_name: str
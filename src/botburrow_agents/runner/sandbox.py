@@ -13,6 +13,7 @@ Supports two modes:
 from __future__ import annotations
 
 import asyncio
+import fnmatch
 import glob
 import json
 import os
@@ -284,15 +285,20 @@ class LocalSandbox(BaseSandbox):
         pattern = args.get("pattern", "")
 
         try:
-            # Run glob relative to workspace
-            full_pattern = str(self.workspace / pattern)
-            matches = glob.glob(full_pattern, recursive=True)
-
-            # Convert to relative paths
-            relative_matches = []
-            for match in matches:
-                rel_path = os.path.relpath(match, self.workspace)
-                relative_matches.append(rel_path)
+            if "/" not in pattern and "**" not in pattern:
+                # Flat pattern: a single scandir pass uses cached d_type
+                # instead of building and stat-ing a path per entry
+                relative_matches = self._scan_workspace(pattern)
+            else:
+                # Run glob relative to workspace
+                full_pattern = str(self.workspace / pattern)
+                matches = glob.glob(full_pattern, recursive=True)
+
+                # Convert to relative paths
+                relative_matches = []
+                for match in matches:
+                    rel_path = os.path.relpath(match, self.workspace)
+                    relative_matches.append(rel_path)
 
             if not relative_matches:
                 return ToolResult(output="No files found matching pattern.")
@@ -301,6 +307,19 @@ class LocalSandbox(BaseSandbox):
         except Exception as e:
             return ToolResult(error=f"Glob failed: {e}")
 
+    def _scan_workspace(self, pattern: str) -> list[str]:
+        """Match a single-component glob pattern against workspace files."""
+        # Like glob, hidden entries only match patterns that start with a dot
+        include_hidden = pattern.startswith(".")
+        with os.scandir(self.workspace) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if (include_hidden or not entry.name.startswith("."))
+                and fnmatch.fnmatch(entry.name, pattern)
+                and entry.is_file()
+            ]
+
     async def _grep(self, args: dict[str, Any]) -> ToolResult:
         """Search for text in files."""
         import shlex
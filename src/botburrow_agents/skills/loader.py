@@ -6,9 +6,12 @@ Per ADR-025 and ADR-028, skills provide instructions to agents.
 
 from __future__ import annotations
 
-import re
+import asyncio
+import copy
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 import structlog
 import yaml
@@ -16,10 +19,17 @@ import yaml
 from botburrow_agents.models import AgentConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from botburrow_agents.clients.git import GitClient
 
+T = TypeVar("T")
+
 logger = structlog.get_logger(__name__)
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class Skill:
@@ -29,19 +39,106 @@ class Skill:
     description: str
     version: str = "1.0.0"
     author: str = "unknown"
-    tags: list[str] = field(default_factory=list)
+    tags: frozenset[str] = field(default_factory=frozenset)
 
     # Requirements
-    requires_cli: list[str] = field(default_factory=list)
-    requires_grants: list[str] = field(default_factory=list)
+    requires_cli: frozenset[str] = field(default_factory=frozenset)
+    requires_grants: frozenset[str] = field(default_factory=frozenset)
 
     # When to load
-    triggers_keywords: list[str] = field(default_factory=list)
+    triggers_keywords: tuple[str, ...] = field(default_factory=tuple)
     triggers_communities: list[str] = field(default_factory=list)
 
     # The actual instructions
     instructions: str = ""
 
+    # Rendered prompt section, keyed by the fields it was rendered from
+    _prompt_key: tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _prompt_fragment: str = field(default="", init=False, repr=False, compare=False)
+    # Lowercased trigger keywords, keyed by the keywords they were built from
+    _triggers_key: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _triggers_lower: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Membership-only fields are stored as sets, whatever was passed in
+        self.tags = _to_frozenset(self.tags)
+        self.requires_cli = _to_frozenset(self.requires_cli)
+        self.requires_grants = _to_frozenset(self.requires_grants)
+        self.triggers_keywords = _to_tuple(self.triggers_keywords)
+
+    @property
+    def prompt_fragment(self) -> str:
+        """This skill's section of the system prompt, rendered once per content."""
+        key = (self.name, self.description, self.instructions)
+        if key != self._prompt_key:
+            self._prompt_fragment = (
+                f"### {self.name}\n\n*{self.description}*\n\n{self.instructions}\n\n---\n"
+            )
+            self._prompt_key = key
+        return self._prompt_fragment
+
+    @property
+    def triggers_lower(self) -> tuple[str, ...]:
+        """Trigger keywords lowercased for matching, rebuilt when they change."""
+        key = tuple(self.triggers_keywords)
+        if key != self._triggers_key:
+            self._triggers_lower = tuple(keyword.lower() for keyword in key)
+            self._triggers_key = key
+        return self._triggers_lower
+
+
+def _to_tuple(value: Any) -> tuple[str, ...]:
+    """Coerce a frontmatter list (or lone string / None) to a tuple."""
+    if isinstance(value, tuple):
+        return value
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(str(item) for item in value)
+
+
+def _to_frozenset(value: Any) -> frozenset[str]:
+    """Coerce a frontmatter list (or lone string / None) to a frozenset."""
+    if isinstance(value, frozenset):
+        return value
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        return frozenset((value,))
+    return frozenset(str(item) for item in value)
+
+
+def _split_frontmatter(content: str) -> tuple[str, str] | None:
+    """Split SKILL.md content into frontmatter text and body.
+
+    Frontmatter is delimited by lines consisting of ``---`` (trailing
+    whitespace allowed), starting on the first line.
+
+    Returns:
+        (frontmatter, body), or None if there is no complete frontmatter block
+    """
+    opening, sep, _ = content.partition("\n")
+    if not sep or opening.rstrip() != "---":
+        return None
+
+    start = len(opening) + 1
+    # Scan for closing delimiters from the newline ending the opening line,
+    # so an empty block ("---\n---") is found too
+    pos = start - 1
+    while (pos := content.find("\n---", pos)) != -1:
+        line_end = content.find("\n", pos + 4)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[pos + 4 : line_end].strip():
+            return content[start:pos] if pos >= start else "", content[line_end + 1 :]
+        pos += 4
+    return None
+
 
 class SkillLoader:
     """Loads skills from Git repository.
@@ -59,7 +156,7 @@ class SkillLoader:
             name="hub-post",
             description="Post content to Botburrow Hub",
             author="botburrow",
-            requires_grants=["hub:write"],
+            requires_grants=frozenset({"hub:write"}),
             instructions="""# Posting to Botburrow Hub
 
 Use the Hub tools to post content.
@@ -90,7 +187,7 @@ Keep posts concise and relevant to the community.
             name="hub-search",
             description="Search posts in Botburrow Hub",
             author="botburrow",
-            requires_grants=["hub:read"],
+            requires_grants=frozenset({"hub:read"}),
             instructions="""# Searching Botburrow Hub
 
 Use the search tool to find relevant posts.
@@ -112,6 +209,13 @@ Use search to find context before responding.
         ),
     }
 
+    # Parsed Git skills shared by all loaders, keyed by (name, content digest)
+    # so the same SKILL.md is only parsed once however many agents load it
+    PARSE_CACHE_SIZE = 1024
+    # Maximum skill fetches in flight at once
+    FETCH_CONCURRENCY = 8
+    _parse_cache: ClassVar[OrderedDict[tuple[str, bytes], Skill]] = OrderedDict()
+
     def __init__(self, git: GitClient) -> None:
         self.git = git
 
@@ -133,21 +237,39 @@ Use search to find context before responding.
                 skills.append(skill)
 
         # 2. Load agent-specified skills
-        for skill_name in agent.capabilities.skills:
-            try:
-                skill = await self.load_skill(skill_name)
-                if skill and self._has_required_grants(agent, skill):
-                    skills.append(skill)
-            except Exception as e:
+        skill_names = agent.capabilities.skills
+        results = await self._gather_bounded(self.load_skill, skill_names)
+        for skill_name, result in zip(skill_names, results, strict=True):
+            if isinstance(result, Exception):
                 logger.warning(
                     "skill_load_failed",
                     skill=skill_name,
-                    error=str(e),
+                    error=str(result),
                 )
+            elif result and self._has_required_grants(agent, result):
+                skills.append(result)
 
         logger.debug("skills_loaded", count=len(skills), agent=agent.name)
         return skills
 
+    async def _gather_bounded(
+        self, fetch: Callable[[str], Awaitable[T]], skill_names: list[str]
+    ) -> list[T | Exception]:
+        """Run fetch for each skill concurrently, at most FETCH_CONCURRENCY at once.
+
+        Results are in skill_names order; failures are returned, not raised.
+        """
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+
+        async def run(skill_name: str) -> T | Exception:
+            async with semaphore:
+                try:
+                    return await fetch(skill_name)
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*(run(name) for name in skill_names))
+
     async def load_skill(self, skill_name: str) -> Skill | None:
         """Load a single skill from Git.
 
@@ -163,12 +285,37 @@ Use search to find context before responding.
 
         # Load from Git
         try:
-            content = await self.git.get_skill(skill_name)
-            return self._parse_skill(skill_name, content)
+            data = await self.git.get_skill_bytes(skill_name)
+            return self._parse_skill_cached(skill_name, data)
         except FileNotFoundError:
             logger.warning("skill_not_found", skill=skill_name)
             return None
 
+    def _parse_skill_cached(self, name: str, content: bytes) -> Skill:
+        """Parse raw SKILL.md bytes, reusing earlier results for identical content.
+
+        The bytes are hashed as-is and only decoded on a cache miss, where
+        the prompt fragment and lowercased triggers are also built once on
+        the cached entry. Returns a shallow copy (carrying both) so callers
+        can reassign fields without affecting the cached entry.
+        """
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        key = (name, digest)
+
+        skill = self._parse_cache.get(key)
+        if skill is not None:
+            self._parse_cache.move_to_end(key)
+        else:
+            skill = self._parse_skill(name, content.decode("utf-8"))
+            # Build the derived values once; every copy shares them
+            skill.prompt_fragment  # noqa: B018
+            skill.triggers_lower  # noqa: B018
+            self._parse_cache[key] = skill
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        return copy.copy(skill)
+
     def _parse_skill(self, name: str, content: str) -> Skill:
         """Parse SKILL.md content into Skill object.
 
@@ -186,13 +333,9 @@ Use search to find context before responding.
         Markdown content...
         """
         # Split frontmatter and content
-        frontmatter_match = re.match(
-            r"^---\s*\n(.*?)\n---\s*\n(.*)$",
-            content,
-            re.DOTALL,
-        )
+        split = _split_frontmatter(content)
 
-        if not frontmatter_match:
+        if split is None:
             # No frontmatter, treat entire content as instructions
             return Skill(
                 name=name,
@@ -200,13 +343,18 @@ Use search to find context before responding.
                 instructions=content,
             )
 
-        frontmatter_text = frontmatter_match.group(1)
-        instructions = frontmatter_match.group(2).strip()
+        frontmatter_text, instructions = split
+        instructions = instructions.strip()
 
-        # Parse YAML frontmatter
-        try:
-            metadata = yaml.safe_load(frontmatter_text) or {}
-        except yaml.YAMLError:
+        # Parse YAML frontmatter (empty frontmatter skips the loader)
+        metadata = None
+        if frontmatter_text.strip():
+            try:
+                metadata = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
+            except yaml.YAMLError:
+                logger.debug("skill_frontmatter_invalid", skill=name)
+        if not isinstance(metadata, dict):
+            # Empty, invalid or non-mapping frontmatter carries no metadata
             metadata = {}
 
         # Extract trigger info
@@ -232,23 +380,22 @@ Use search to find context before responding.
         )
 
     def _has_required_grants(self, agent: AgentConfig, skill: Skill) -> bool:
-        """Check if agent has required grants for skill."""
-        agent_grants = set(agent.capabilities.grants)
+        """Check if agent has required grants for skill.
 
-        for required in skill.requires_grants:
-            service = required.split(":")[0]
-
-            # Check various grant formats
-            if required in agent_grants:
-                continue
-            if f"{service}:*" in agent_grants:
-                continue
-            if any(g.startswith(f"{service}:") for g in agent_grants):
-                continue
+        A requirement is met by the exact grant, or by any grant for the
+        same service (including the ``service:*`` wildcard).
+        """
+        # Each requirement is a set lookup rather than a scan over every grant
+        agent_grants, granted_services = agent.compiled_grants
 
-            return False
+        return all(
+            required in agent_grants or required.split(":", 1)[0] in granted_services
+            for required in skill.requires_grants
+        )
 
-        return True
+    def _matches_triggers(self, skill: Skill, content_lower: str) -> bool:
+        """Check if any of the skill's trigger keywords occur in the content."""
+        return any(keyword in content_lower for keyword in skill.triggers_lower)
 
     def skills_to_prompt(self, skills: list[Skill]) -> str:
         """Convert loaded skills to system prompt section.
@@ -263,13 +410,7 @@ Use search to find context before responding.
             return ""
 
         sections = ["## Available Skills\n"]
-
-        for skill in skills:
-            sections.append(f"### {skill.name}\n")
-            sections.append(f"*{skill.description}*\n")
-            sections.append(skill.instructions)
-            sections.append("\n---\n")
-
+        sections.extend(skill.prompt_fragment for skill in skills)
         return "\n".join(sections)
 
     async def load_contextual_skills(
@@ -289,24 +430,32 @@ Use search to find context before responding.
             List of matching skills
         """
         content_lower = task_content.lower()
-        matching = []
+
+        async def check(skill_name: str) -> Skill | None:
+            # Check triggers from the frontmatter alone first, so Git
+            # skills that cannot match are never fetched in full
+            if skill_name not in self.NATIVE_SKILLS:
+                head = await self.git.get_skill_head(skill_name)
+                if _split_frontmatter(head) is not None:
+                    # Parsed uncached: head-only skills must not take parse cache slots
+                    probe = self._parse_skill(skill_name, head)
+                    if not self._matches_triggers(probe, content_lower):
+                        return None
+
+            skill = await self.load_skill(skill_name)
+            if skill and self._matches_triggers(skill, content_lower):
+                return skill
+            return None
 
         # Check all available skills
         available_skills = await self.git.list_skills()
+        results = await self._gather_bounded(check, available_skills)
 
-        for skill_name in available_skills:
-            try:
-                skill = await self.load_skill(skill_name)
-                if not skill:
-                    continue
-
-                # Check if any keywords match
-                for keyword in skill.triggers_keywords:
-                    if keyword.lower() in content_lower and self._has_required_grants(agent, skill):
-                        matching.append(skill)
-                        break
-
-            except Exception as e:
-                logger.debug("skill_check_failed", skill=skill_name, error=str(e))
+        matching = []
+        for skill_name, result in zip(available_skills, results, strict=True):
+            if isinstance(result, Exception):
+                logger.debug("skill_check_failed", skill=skill_name, error=str(result))
+            elif result and self._has_required_grants(agent, result):
+                matching.append(result)
 
         return matching
@@ -171,6 +171,33 @@ brain:
         skill = await client2.get_skill("test-skill")
         assert skill == "Skill instructions here."
 
+    @pytest.mark.asyncio
+    async def test_get_skill_bytes_local(self, client, temp_configs_dir, monkeypatch):
+        """Test loading undecoded skill bytes from local filesystem."""
+        skill_dir = temp_configs_dir / "skills" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_bytes("Skill \u2014 instructions.".encode())
+
+        monkeypatch.setenv("AGENT_DEFINITIONS_PATH", str(temp_configs_dir))
+        client2 = client.__class__(client.settings)
+
+        data = await client2.get_skill_bytes("test-skill")
+        assert data == "Skill \u2014 instructions.".encode()
+
+    @pytest.mark.asyncio
+    async def test_get_skill_head_local(self, client, temp_configs_dir, monkeypatch):
+        """Test reading only the leading complete lines of a local skill."""
+        skill_dir = temp_configs_dir / "skills" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: test\n---\n" + "body line\n" * 100)
+
+        monkeypatch.setenv("AGENT_DEFINITIONS_PATH", str(temp_configs_dir))
+        client2 = client.__class__(client.settings)
+
+        head = await client2.get_skill_head("test-skill", max_bytes=34)
+        # The partial "body" line at the 34 byte cut is dropped
+        assert head == "---\nname: test\n---\nbody line\n"
+
     @pytest.mark.asyncio
     async def test_get_skill_local_not_found(self, client, temp_configs_dir, monkeypatch):
         """Test loading missing skill from local."""
@@ -377,10 +404,54 @@ behavior:
 
 Instructions for using this skill.
 """
-        with patch.object(client, "_fetch_from_github", new=AsyncMock(return_value=skill_content)):
+        with patch.object(
+            client,
+            "_fetch_bytes_from_github",
+            new=AsyncMock(return_value=skill_content.encode()),
+        ):
             skill = await client.get_skill("test-skill")
             assert skill == skill_content
 
+    @pytest.mark.asyncio
+    async def test_get_skill_bytes_github(self, client):
+        """Test loading undecoded skill bytes from GitHub."""
+        with patch.object(
+            client, "_fetch_bytes_from_github", new=AsyncMock(return_value=b"# Test Skill\n")
+        ):
+            data = await client.get_skill_bytes("test-skill")
+            assert data == b"# Test Skill\n"
+
+    @pytest.mark.asyncio
+    async def test_fetch_head_from_github_sends_range(self, client):
+        """Test head fetches ask GitHub for only the leading bytes."""
+        response = MagicMock()
+        response.content = b"---\nname: test"
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=response)
+
+        with patch.object(client, "_get_http_client", return_value=http_client):
+            data = await client._fetch_head_from_github("https://example.com/SKILL.md", 16)
+
+        http_client.get.assert_awaited_once_with(
+            "https://example.com/SKILL.md", headers={"Range": "bytes=0-15"}
+        )
+        response.raise_for_status.assert_called_once()
+        assert data == b"---\nname: test"
+
+    @pytest.mark.asyncio
+    async def test_fetch_head_from_github_truncates_full_response(self, client):
+        """Test a server ignoring Range (full 200) is still cut to max_bytes."""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b"x" * 64
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=response)
+
+        with patch.object(client, "_get_http_client", return_value=http_client):
+            data = await client._fetch_head_from_github("https://example.com/SKILL.md", 16)
+
+        assert data == b"x" * 16
+
     @pytest.mark.asyncio
     async def test_get_skill_github_404(self, client):
         """Test GitHub 404 when loading skill."""
@@ -397,7 +468,7 @@ Instructions for using this skill.
             )
 
         with (
-            patch.object(client, "_fetch_from_github", new=AsyncMock(side_effect=raise_404)),
+            patch.object(client, "_fetch_bytes_from_github", new=AsyncMock(side_effect=raise_404)),
             pytest.raises(FileNotFoundError),
         ):
             await client.get_skill("nonexistent-skill")
@@ -8,18 +8,6 @@ from fakeredis import aioredis as fakeredis
 from botburrow_agents.clients.redis import RedisClient, RedisLock
 from botburrow_agents.config import Settings
 
-# Check if Lua scripting is available (needed for eval command in lock tests)
-try:
-    import lupa  # noqa: F401
-
-    HAS_LUA = True
-except ImportError:
-    HAS_LUA = False
-
-requires_lua = pytest.mark.skipif(
-    not HAS_LUA, reason="Requires lupa for Lua scripting support in fakeredis"
-)
-
 
 @pytest.fixture
 async def redis_client_with_fake(
@@ -103,6 +91,17 @@ class TestRedisClientBasicOperations:
         await redis_client_with_fake.set("exists", "value")
         assert await redis_client_with_fake.exists("exists")
 
+    @pytest.mark.asyncio
+    async def test_mget(self, redis_client_with_fake: RedisClient) -> None:
+        """Test getting several keys at once."""
+        await redis_client_with_fake._ensure_connected()
+
+        await redis_client_with_fake.set("first", "1")
+        await redis_client_with_fake.set("third", "3")
+
+        assert await redis_client_with_fake.mget("first", "second", "third") == ["1", None, "3"]
+        assert await redis_client_with_fake.mget() == []
+
     @pytest.mark.asyncio
     async def test_incr(self, redis_client_with_fake: RedisClient) -> None:
         """Test incrementing a counter."""
@@ -203,7 +202,7 @@ class TestRedisLock:
         assert lock1.acquired is True
         assert lock2.acquired is False
 
-    @requires_lua
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_lock_release(self, redis_client_with_fake: RedisClient) -> None:
         """Test releasing a lock."""
@@ -220,7 +219,7 @@ class TestRedisLock:
         lock2 = await redis_client_with_fake.acquire_lock("release-lock", "owner-2", ttl=60)
         assert lock2.acquired is True
 
-    @requires_lua
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_lock_context_manager(self, redis_client_with_fake: RedisClient) -> None:
         """Test lock as context manager."""
@@ -235,7 +234,7 @@ class TestRedisLock:
         lock2 = await redis_client_with_fake.acquire_lock("ctx-lock", "owner-2", ttl=60)
         assert lock2.acquired is True
 
-    @requires_lua
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_lock_extend(self, redis_client_with_fake: RedisClient) -> None:
         """Test extending lock TTL."""
@@ -248,7 +247,7 @@ class TestRedisLock:
         extended = await lock.extend(additional_ttl=60)
         assert extended is True
 
-    @requires_lua
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_lock_release_only_by_owner(self, redis_client_with_fake: RedisClient) -> None:
         """Test that only owner can release lock."""
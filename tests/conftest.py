@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+import io
+import tarfile
+from collections.abc import AsyncGenerator, Callable
 from datetime import UTC
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fakeredis import aioredis as fakeredis
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not installed on Windows
+    pass
+else:
+    # pytest-asyncio builds its loops from the active policy
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+try:
+    import lupa  # noqa: F401
+except ImportError:
+    HAS_LUA = False
+else:
+    HAS_LUA = True
+
 from botburrow_agents.config import Settings
 from botburrow_agents.models import (
     AgentConfig,
@@ -24,9 +43,19 @@ from botburrow_agents.models import (
 )
 
 
-@pytest.fixture
-def settings() -> Settings:
-    """Test settings."""
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Skip requires_lua tests when fakeredis has no Lua support."""
+    if HAS_LUA:
+        return
+    skip_lua = pytest.mark.skip(reason="Requires lupa for Lua scripting support in fakeredis")
+    for item in items:
+        if "requires_lua" in item.keywords:
+            item.add_marker(skip_lua)
+
+
+@pytest.fixture(scope="session")
+def _settings_template() -> Settings:
+    """Test settings, validated once per session."""
     return Settings(
         hub_url="http://test-hub:8000",
         hub_api_key="test-key",
@@ -43,8 +72,18 @@ def settings() -> Settings:
 
 
 @pytest.fixture
-def agent_config() -> AgentConfig:
-    """Test agent configuration."""
+def settings(_settings_template: Settings) -> Settings:
+    """Test settings.
+
+    Copied from the session template, so tests may change fields without
+    re-reading the environment and re-validating.
+    """
+    return _settings_template.model_copy()
+
+
+@pytest.fixture(scope="session")
+def _agent_config_template() -> AgentConfig:
+    """Validated agent configuration, built once per session."""
     return AgentConfig(
         name="test-agent",
         type="claude-code",
@@ -69,6 +108,42 @@ def agent_config() -> AgentConfig:
     )
 
 
+@pytest.fixture
+def agent_config(_agent_config_template: AgentConfig) -> AgentConfig:
+    """Test agent configuration.
+
+    Deep-copied from the session template so tests can mutate it freely
+    without paying for pydantic validation each time.
+    """
+    return _agent_config_template.model_copy(deep=True)
+
+
+@pytest.fixture
+def stage_files() -> Callable[[Path, dict[str, bytes]], None]:
+    """Create several workspace files in one batch.
+
+    Files are packed into an in-memory tar archive and extracted in a
+    single pass instead of one write_text call per file.
+    """
+
+    def _stage(workspace: Path, files: dict[str, bytes]) -> None:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        buffer.seek(0)
+        with tarfile.open(fileobj=buffer, mode="r") as archive:
+            # Extraction filters arrived in 3.11.4; the archive is built above
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(workspace, filter="data")
+            else:
+                archive.extractall(workspace)
+
+    return _stage
+
+
 @pytest.fixture
 def assignment(agent_config: AgentConfig) -> Assignment:
     """Test assignment."""
@@ -147,6 +222,7 @@ def mock_redis_client() -> AsyncMock:
     mock.connect.return_value = None
     mock.close.return_value = None
     mock.exists.return_value = False
+    mock.mget.side_effect = lambda *keys: [None] * len(keys)
     mock.set.return_value = True
     mock.get.return_value = None
     mock.delete.return_value = 1
@@ -170,6 +246,8 @@ def mock_git_client(agent_config: AgentConfig) -> AsyncMock:
     mock.list_skills.return_value = ["hub-post", "hub-search"]
     mock.list_agents.return_value = ["test-agent"]
     mock.get_skill.return_value = "# Test Skill\n\nInstructions here."
+    mock.get_skill_bytes.return_value = b"# Test Skill\n\nInstructions here."
+    mock.get_skill_head.return_value = "# Test Skill\n\nInstructions here."
     mock.get_system_prompt.return_value = agent_config.system_prompt
     mock.use_local = False
     return mock
@@ -177,15 +255,11 @@ def mock_git_client(agent_config: AgentConfig) -> AsyncMock:
 
 @pytest.fixture
 async def fake_redis() -> AsyncGenerator[fakeredis.FakeRedis, None]:
-    """Fake Redis for testing with Lua scripting support."""
-    # Enable Lua scripting for eval/evalsha commands used in locks
-    try:
-        # Try with lupa-based Lua support
-        import lupa  # noqa: F401
-
-        redis = fakeredis.FakeRedis(decode_responses=True)
-    except ImportError:
-        # Fall back to fakeredis without Lua - some lock tests will be skipped
-        redis = fakeredis.FakeRedis(decode_responses=True)
+    """Fake Redis for testing.
+
+    Lua scripts (EVAL/EVALSHA) only run when lupa is installed; tests that
+    need them are marked requires_lua and skipped otherwise.
+    """
+    redis = fakeredis.FakeRedis(decode_responses=True)
     yield redis
     await redis.aclose()
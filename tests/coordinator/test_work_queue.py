@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import time
+from dataclasses import replace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -23,18 +25,6 @@ from botburrow_agents.coordinator.work_queue import (
 )
 from botburrow_agents.models import TaskType
 
-# Check if Lua scripting is available (needed for eval command in leader election)
-try:
-    import lupa  # noqa: F401
-
-    HAS_LUA = True
-except ImportError:
-    HAS_LUA = False
-
-requires_lua = pytest.mark.skipif(
-    not HAS_LUA, reason="Requires lupa for Lua scripting support in fakeredis"
-)
-
 
 @pytest.fixture
 def work_item() -> WorkItem:
@@ -61,11 +51,11 @@ class TestWorkItemSerialization:
 
     def test_to_json(self, work_item: WorkItem) -> None:
         """Test serializing work item to JSON."""
-        json_str = work_item.to_json()
+        data = json.loads(work_item.to_json())
 
-        assert '"agent_id": "test-agent"' in json_str
-        assert '"task_type": "inbox"' in json_str
-        assert '"priority": "normal"' in json_str
+        assert data["agent_id"] == "test-agent"
+        assert data["task_type"] == "inbox"
+        assert data["priority"] == "normal"
 
     def test_from_json(self, work_item: WorkItem) -> None:
         """Test deserializing work item from JSON."""
@@ -86,6 +76,7 @@ class TestWorkItemSerialization:
         assert item.inbox_count == 0  # Default
 
 
+@pytest.mark.requires_lua
 class TestWorkQueueEnqueue:
     """Tests for enqueuing work."""
 
@@ -106,8 +97,7 @@ class TestWorkQueueEnqueue:
     @pytest.mark.asyncio
     async def test_enqueue_high_priority(self, work_queue: WorkQueue, work_item: WorkItem) -> None:
         """Test enqueuing to high priority queue."""
-        work_item.priority = "high"
-        result = await work_queue.enqueue(work_item)
+        result = await work_queue.enqueue(replace(work_item, priority="high"))
 
         assert result is True
 
@@ -118,8 +108,7 @@ class TestWorkQueueEnqueue:
     @pytest.mark.asyncio
     async def test_enqueue_low_priority(self, work_queue: WorkQueue, work_item: WorkItem) -> None:
         """Test enqueuing to low priority queue."""
-        work_item.priority = "low"
-        await work_queue.enqueue(work_item)
+        await work_queue.enqueue(replace(work_item, priority="low"))
 
         r = await work_queue.redis._ensure_connected()
         assert await r.llen(QUEUE_LOW) == 1
@@ -159,6 +148,7 @@ class TestWorkQueueEnqueue:
 class TestWorkQueueClaim:
     """Tests for claiming work."""
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_claim_respects_priority_order(self, work_queue: WorkQueue) -> None:
         """Test that high priority items are claimed first."""
@@ -192,6 +182,7 @@ class TestWorkQueueClaim:
         assert claimed is not None
         assert claimed.agent_id == "high-agent"
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_claim_marks_as_active(self, work_queue: WorkQueue, work_item: WorkItem) -> None:
         """Test that claimed work is marked as active."""
@@ -273,6 +264,7 @@ class TestWorkQueueCircuitBreaker:
         assert backoff is not None
         assert float(backoff) > time.time()
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_backoff_prevents_enqueue(
         self, work_queue: WorkQueue, work_item: WorkItem
@@ -287,6 +279,7 @@ class TestWorkQueueCircuitBreaker:
         result = await work_queue.enqueue(work_item)
         assert result is False
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_expired_backoff_allows_enqueue(
         self, work_queue: WorkQueue, work_item: WorkItem
@@ -481,6 +474,7 @@ class TestLeaderElection:
         mock_redis_client._ensure_connected = AsyncMock(return_value=fake_redis)
         return LeaderElection(mock_redis_client, "instance-1")
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_become_leader(self, leader_election: LeaderElection) -> None:
         """Test acquiring leadership."""
@@ -489,6 +483,7 @@ class TestLeaderElection:
         assert result is True
         assert leader_election.is_leader is True
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_only_one_leader(self, fake_redis: fakeredis.FakeRedis) -> None:
         """Test that only one instance can be leader."""
@@ -508,7 +503,7 @@ class TestLeaderElection:
         assert leader1.is_leader is True
         assert leader2.is_leader is False
 
-    @requires_lua
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_release_leadership(
         self, leader_election: LeaderElection, fake_redis: fakeredis.FakeRedis
@@ -528,6 +523,7 @@ class TestLeaderElection:
         result = await leader2.try_become_leader()
         assert result is True
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_refresh_leadership(self, leader_election: LeaderElection) -> None:
         """Test that leader can refresh their leadership."""
@@ -203,7 +203,7 @@ class TestActivationFlow:
             ),
         ]
 
-        redis.exists = AsyncMock(return_value=False)
+        redis.mget = AsyncMock(return_value=[None, None])
 
         scheduler = Scheduler(hub, redis, settings)
 
@@ -465,6 +465,7 @@ class TestScalabilityPatterns:
 
         await fake_redis.aclose()
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_concurrent_claim_deduplication(self, settings):
         """Test that same agent cannot be claimed twice."""
@@ -492,6 +493,7 @@ class TestScalabilityPatterns:
 
         await fake_redis.aclose()
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_circuit_breaker_on_failures(self, settings):
         """Test circuit breaker triggers after repeated failures."""
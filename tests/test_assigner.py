@@ -236,7 +236,7 @@ class TestAssignerHeartbeat:
         data = json.loads(value)
         assert data["runner_id"] == "runner-1"
         assert data["status"] == "busy"
-        assert "timestamp" in data
+        assert datetime.fromisoformat(data["timestamp"]).tzinfo is not None
 
 
 class TestAssignerGetActiveRunners:
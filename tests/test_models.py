@@ -1,7 +1,10 @@
 """Tests for data models."""
 
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 
+import pytest
+
 from botburrow_agents.models import (
     AgentConfig,
     Assignment,
@@ -48,6 +51,19 @@ class TestAgentConfig:
         assert config.type == "goose"
         assert config.brain.provider == "openai"
 
+    def test_compiled_grants_follow_mutation(self) -> None:
+        """Test compiled grants are rebuilt after the grants list changes."""
+        config = AgentConfig(name="test-agent")
+        config.capabilities.grants.append("github:read")
+
+        assert config.compiled_grants == (frozenset({"github:read"}), frozenset({"github"}))
+
+        config.capabilities.grants.append("hub:*")
+
+        exact, services = config.compiled_grants
+        assert "hub:*" in exact
+        assert services == frozenset({"github", "hub"})
+
 
 class TestAssignment:
     """Tests for Assignment model."""
@@ -76,6 +92,15 @@ class TestAssignment:
         assert assignment.task_type == TaskType.DISCOVERY
         assert assignment.last_activated is not None
 
+    def test_assignment_is_immutable_and_hashable(self) -> None:
+        """Test assignments can be used as dedup keys."""
+        first = Assignment(agent_id="agent-1", agent_name="A", task_type=TaskType.INBOX)
+        second = Assignment(agent_id="agent-1", agent_name="A", task_type=TaskType.INBOX)
+
+        assert len({first, second}) == 1
+        with pytest.raises(FrozenInstanceError):
+            first.inbox_count = 3  # type: ignore[misc]
+
 
 class TestContext:
     """Tests for Context model."""
@@ -13,10 +13,8 @@ Tests all monitoring requirements from bd-23c:
 
 from __future__ import annotations
 
-import asyncio
 import time
-from collections.abc import AsyncIterator, Iterator
-from typing import Any
+from collections.abc import Iterator
 
 import pytest
 import respx
@@ -27,9 +25,6 @@ from botburrow_agents.clients.hub import HubClient
 from botburrow_agents.coordinator.work_queue import (
     AGENT_BACKOFF,
     AGENT_FAILURES,
-    QUEUE_HIGH,
-    QUEUE_LOW,
-    QUEUE_NORMAL,
     WorkItem,
     WorkQueue,
 )
@@ -57,122 +52,6 @@ from botburrow_agents.runner.metrics import (
 # ============================================================================
 
 
-@pytest.fixture
-def mock_redis() -> Iterator[dict[str, Any]]:
-    """Mock Redis client for testing."""
-    state: dict[str, Any] = {
-        "lists": {
-            QUEUE_HIGH: [],
-            QUEUE_NORMAL: [],
-            QUEUE_LOW: [],
-        },
-        "hashes": {
-            "work:active": {},
-            "work:failures": {},
-            "work:backoff": {},
-        },
-        "strings": {},
-    }
-
-    class MockRedis:
-        async def _ensure_connected(self):
-            return self
-
-        async def lpush(self, key: str, *values: str) -> int:
-            state["lists"].setdefault(key, [])
-            state["lists"][key] = list(reversed(values)) + state["lists"][key]
-            return len(state["lists"][key])
-
-        async def brpop(
-            self, keys: list[str], timeout: int = 30
-        ) -> tuple[str, str] | None:
-            start = time.time()
-            while time.time() - start < timeout:
-                for key in keys:
-                    if state["lists"].get(key):
-                        value = state["lists"][key].pop()
-                        return (key, value)
-                await asyncio.sleep(0.01)
-            return None
-
-        async def llen(self, key: str) -> int:
-            return len(state["lists"].get(key, []))
-
-        async def hset(self, name: str, key: str, value: str | int | float) -> int:
-            state["hashes"].setdefault(name, {})
-            state["hashes"][name][key] = str(value)
-            return 0
-
-        async def hget(self, name: str, key: str) -> str | None:
-            return state["hashes"].get(name, {}).get(key)
-
-        async def hgetall(self, name: str) -> dict[str, str]:
-            return state["hashes"].get(name, {})
-
-        async def hdel(self, name: str, *keys: str) -> int:
-            count = 0
-            for key in keys:
-                if key in state["hashes"].get(name, {}):
-                    del state["hashes"][name][key]
-                    count += 1
-            return count
-
-        async def hincrby(self, name: str, key: str, value: int) -> int:
-            state["hashes"].setdefault(name, {})
-            current = int(state["hashes"][name].get(key, 0))
-            new_value = current + value
-            state["hashes"][name][key] = str(new_value)
-            return new_value
-
-        async def hlen(self, name: str) -> int:
-            return len(state["hashes"].get(name, {}))
-
-        async def set(
-            self,
-            key: str,
-            value: str,
-            nx: bool = False,
-            ex: int | None = None,  # noqa: ARG002
-        ) -> bool:
-            if nx and key in state["strings"]:
-                return False
-            state["strings"][key] = value
-            return True
-
-        async def get(self, key: str) -> str | None:
-            return state["strings"].get(key)
-
-        async def delete(self, *keys: str) -> int:
-            count = 0
-            for key in keys:
-                if key in state["strings"]:
-                    del state["strings"][key]
-                    count += 1
-            return count
-
-        async def expire(self, key: str, seconds: int) -> bool:  # noqa: ARG002
-            return key in state["strings"]
-
-        async def scan_iter(
-            self, match: str = "*", count: int = 10  # noqa: ARG002
-        ) -> AsyncIterator[str]:
-            for key in state["strings"]:
-                if match in key or "*" in match:
-                    yield key
-
-        async def eval(
-            self, script: str, numkeys: int, *args: str  # noqa: ARG002
-        ) -> int:
-            # Simple leader election script simulation
-            key, instance = args[0], args[1]
-            if state["strings"].get(key) == instance:
-                del state["strings"][key]
-                return 1
-            return 0
-
-    yield MockRedis()
-
-
 @pytest.fixture
 def mock_hub_client() -> Iterator[None]:
     """Mock Hub API client."""
@@ -217,18 +96,18 @@ def mock_hub_client() -> Iterator[None]:
 
 
 @pytest.fixture
-def work_queue(mock_redis) -> WorkQueue:
-    """Create a WorkQueue with mock Redis."""
+def work_queue(fake_redis) -> WorkQueue:
+    """Create a WorkQueue backed by fakeredis."""
 
-    # Create mock Redis client wrapper
+    # Minimal RedisClient stand-in handing out the fake connection
     class MockRedisClient:
-        def __init__(self, _mock):
-            self._mock = _mock
+        def __init__(self, _redis):
+            self._redis = _redis
 
         async def _ensure_connected(self):
-            return self._mock
+            return self._redis
 
-    redis_wrapper = MockRedisClient(mock_redis)
+    redis_wrapper = MockRedisClient(fake_redis)
     return WorkQueue(redis_wrapper)  # type: ignore[arg-type]
 
 
@@ -624,6 +503,7 @@ class TestCircuitBreaker:
 class TestRunnerPoolUtilization:
     """Verify runner pool utilization metrics."""
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_queue_depth_metrics(self, work_queue: WorkQueue) -> None:
         """Verify queue depth is tracked per priority."""
@@ -659,6 +539,7 @@ class TestRunnerPoolUtilization:
         assert stats["queue_low"] == 1
         assert stats["total_queued"] == 3
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_active_tasks_metric(self, work_queue: WorkQueue) -> None:
         """Verify active tasks (claimed work) is tracked."""
@@ -691,6 +572,7 @@ class TestRunnerPoolUtilization:
         stats = await work_queue.get_queue_stats()
         assert stats["agents_in_backoff"] == 1
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_update_queue_metrics_updates_prometheus(
         self, work_queue: WorkQueue
@@ -810,6 +692,7 @@ class TestFailedActivationRetry:
         failures = await r.hget(AGENT_FAILURES, "failing-agent")
         assert failures == "3"
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_backoff_prevents_immediate_retry(
         self, work_queue: WorkQueue
@@ -829,6 +712,7 @@ class TestFailedActivationRetry:
         enqueued = await work_queue.enqueue(work_item, force=False)
         assert enqueued is False, "Work should not be enqueued while in backoff"
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_backoff_expires_after_time(self, work_queue: WorkQueue) -> None:
         """Verify backoff expires after time elapses."""
@@ -877,6 +761,7 @@ class TestFailedActivationRetry:
 # ============================================================================
 
 
+@pytest.mark.requires_lua
 class TestPriorityQueueOrdering:
     """Verify priority queue ordering (high priority first)."""
 
@@ -5,23 +5,25 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from botburrow_agents.clients.redis import RedisClient
 from botburrow_agents.config import ActivationMode
 from botburrow_agents.coordinator.scheduler import PriorityQueue, Scheduler
 from botburrow_agents.models import Assignment, TaskType
 
 
+@pytest.fixture
+def scheduler(settings, mock_hub_client, mock_redis_client):
+    """Create scheduler with mocks."""
+    return Scheduler(
+        hub=mock_hub_client,
+        redis=mock_redis_client,
+        settings=settings,
+    )
+
+
 class TestScheduler:
     """Tests for Scheduler class."""
 
-    @pytest.fixture
-    def scheduler(self, settings, mock_hub_client, mock_redis_client):
-        """Create scheduler with mocks."""
-        return Scheduler(
-            hub=mock_hub_client,
-            redis=mock_redis_client,
-            settings=settings,
-        )
-
     @pytest.mark.asyncio
     async def test_get_notification_assignment(self, scheduler, mock_hub_client):
         """Test getting notification assignment."""
@@ -119,11 +121,16 @@ class TestScheduler:
         ]
 
         # First agent is locked
-        mock_redis_client.exists.side_effect = [True, False]
+        mock_redis_client.mget.side_effect = None
+        mock_redis_client.mget.return_value = ["runner-1", None]
 
         assignment = await scheduler.get_next_assignment(ActivationMode.NOTIFICATION)
 
         assert assignment.agent_id == "available-agent"
+        # All lock keys are probed in one round trip
+        mock_redis_client.mget.assert_awaited_once_with(
+            "agent_lock:locked-agent", "agent_lock:available-agent"
+        )
 
     @pytest.mark.asyncio
     async def test_returns_none_when_no_work(self, scheduler, mock_hub_client):
@@ -151,21 +158,29 @@ class TestScheduler:
         assert stats["notification_queue"] == 2
         assert stats["exploration_queue"] == 1
 
+    @pytest.mark.asyncio
+    async def test_queue_stats_counts_locked(self, scheduler, mock_hub_client, mock_redis_client):
+        """Test queue statistics exclude locked agents from pending."""
+        mock_hub_client.get_agents_with_notifications.return_value = [
+            Assignment(agent_id="a1", agent_name="A1", task_type=TaskType.INBOX),
+        ]
+        mock_hub_client.get_stale_agents.return_value = [
+            Assignment(agent_id="a2", agent_name="A2", task_type=TaskType.DISCOVERY),
+        ]
+        mock_redis_client.mget.side_effect = None
+        mock_redis_client.mget.return_value = [None, "runner-1"]
+
+        stats = await scheduler.get_queue_stats()
+
+        assert stats["locked_agents"] == 1
+        assert stats["total_pending"] == 1
+
 
 class TestSchedulerDailyLimits:
     """Tests for daily limit checking."""
 
-    @pytest.fixture
-    def scheduler(self, settings, mock_hub_client, mock_redis_client):
-        """Create scheduler with mocks."""
-        return Scheduler(
-            hub=mock_hub_client,
-            redis=mock_redis_client,
-            settings=settings,
-        )
-
     @pytest.mark.asyncio
-    async def test_skips_over_budget_agent(self, scheduler, mock_hub_client, mock_redis_client):
+    async def test_skips_over_budget_agent(self, scheduler, mock_hub_client):
         """Test skips agents that are over budget."""
         mock_hub_client.get_stale_agents.return_value = [
             Assignment(
@@ -175,7 +190,6 @@ class TestSchedulerDailyLimits:
             ),
         ]
         mock_hub_client.get_budget_health.return_value = AsyncMock(healthy=False)
-        mock_redis_client.exists.return_value = False
 
         assignment = await scheduler.get_next_assignment(ActivationMode.EXPLORATION)
 
@@ -183,9 +197,7 @@ class TestSchedulerDailyLimits:
         mock_hub_client.get_budget_health.assert_called_once_with("budget-agent")
 
     @pytest.mark.asyncio
-    async def test_allows_agent_when_budget_check_fails(
-        self, scheduler, mock_hub_client, mock_redis_client
-    ):
+    async def test_allows_agent_when_budget_check_fails(self, scheduler, mock_hub_client):
         """Test allows agent when budget check errors."""
         mock_hub_client.get_stale_agents.return_value = [
             Assignment(
@@ -195,7 +207,6 @@ class TestSchedulerDailyLimits:
             ),
         ]
         mock_hub_client.get_budget_health.side_effect = Exception("API error")
-        mock_redis_client.exists.return_value = False
 
         assignment = await scheduler.get_next_assignment(ActivationMode.EXPLORATION)
 
@@ -205,135 +216,88 @@ class TestSchedulerDailyLimits:
 
 
 class TestPriorityQueue:
-    """Tests for PriorityQueue."""
-
-    @pytest.fixture
-    def mock_redis(self) -> AsyncMock:
-        """Mock Redis client."""
-        mock = AsyncMock()
-        mock._ensure_connected = AsyncMock(return_value=mock)
-        mock.zadd = AsyncMock()
-        mock.zpopmin = AsyncMock()
-        mock.zrem = AsyncMock()
-        mock.zcard = AsyncMock()
-        return mock
+    """Tests for PriorityQueue against an in-process fake Redis."""
 
     @pytest.fixture
-    def queue(self, mock_redis: AsyncMock) -> PriorityQueue:
-        """Create PriorityQueue with mock."""
-        return PriorityQueue(mock_redis)
+    async def queue(self, settings, fake_redis) -> PriorityQueue:
+        """Create PriorityQueue backed by fakeredis."""
+        client = RedisClient(settings)
+        client._redis = fake_redis
+        return PriorityQueue(client)
 
     @pytest.mark.asyncio
-    async def test_add_notification(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_add_notification(self, queue: PriorityQueue, fake_redis) -> None:
         """Test adding to notification queue."""
         await queue.add_notification("agent-1", 5)
 
-        mock_redis.zadd.assert_called_once()
-        call_args = mock_redis.zadd.call_args
-        assert call_args[0][0] == "queue:notifications"
         # Score should be -5 (higher inbox = higher priority)
-        assert call_args[0][1] == {"agent-1": -5}
+        assert await fake_redis.zscore("queue:notifications", "agent-1") == -5
 
     @pytest.mark.asyncio
-    async def test_add_exploration_with_timestamp(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_add_exploration_with_timestamp(self, queue: PriorityQueue, fake_redis) -> None:
         """Test adding to exploration queue with last activated time."""
-        last_activated = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        last_activated = datetime(2024, 1, 1, 12, 0, 0, 750_000, tzinfo=UTC)
         await queue.add_exploration("agent-2", last_activated)
 
-        mock_redis.zadd.assert_called_once()
-        call_args = mock_redis.zadd.call_args
-        assert call_args[0][0] == "queue:exploration"
-        # Score should be timestamp
-        assert call_args[0][1] == {"agent-2": last_activated.timestamp()}
+        # Score should be the timestamp in whole epoch seconds
+        score = await fake_redis.zscore("queue:exploration", "agent-2")
+        assert score == 1_704_110_400
 
     @pytest.mark.asyncio
-    async def test_add_exploration_never_activated(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_add_exploration_never_activated(self, queue: PriorityQueue, fake_redis) -> None:
         """Test adding to exploration queue when never activated."""
         await queue.add_exploration("agent-3", None)
 
-        mock_redis.zadd.assert_called_once()
-        call_args = mock_redis.zadd.call_args
         # Score should be 0 (highest priority)
-        assert call_args[0][1] == {"agent-3": 0}
+        assert await fake_redis.zscore("queue:exploration", "agent-3") == 0
 
     @pytest.mark.asyncio
-    async def test_pop_notification(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_pop_notification(self, queue: PriorityQueue) -> None:
         """Test popping from notification queue."""
-        mock_redis.zpopmin.return_value = [("agent-1", -5)]
+        await queue.add_notification("agent-1", 5)
+        await queue.add_notification("agent-2", 1)
 
         result = await queue.pop_notification()
 
         assert result == "agent-1"
-        mock_redis.zpopmin.assert_called_once_with("queue:notifications")
 
     @pytest.mark.asyncio
-    async def test_pop_notification_empty(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_pop_notification_empty(self, queue: PriorityQueue) -> None:
         """Test popping from empty notification queue."""
-        mock_redis.zpopmin.return_value = []
-
         result = await queue.pop_notification()
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_pop_exploration(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_pop_exploration(self, queue: PriorityQueue) -> None:
         """Test popping from exploration queue."""
-        mock_redis.zpopmin.return_value = [("agent-2", 0)]
+        await queue.add_exploration("agent-1", datetime(2024, 1, 1, tzinfo=UTC))
+        await queue.add_exploration("agent-2", None)
 
         result = await queue.pop_exploration()
 
         assert result == "agent-2"
-        mock_redis.zpopmin.assert_called_once_with("queue:exploration")
 
     @pytest.mark.asyncio
-    async def test_remove(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_remove(self, queue: PriorityQueue, fake_redis) -> None:
         """Test removing agent from all queues."""
+        await queue.add_notification("agent-1", 2)
+        await queue.add_exploration("agent-1", None)
+        await queue.add_exploration("agent-2", None)
+
         await queue.remove("agent-1")
 
-        assert mock_redis.zrem.call_count == 2
-        mock_redis.zrem.assert_any_call("queue:notifications", "agent-1")
-        mock_redis.zrem.assert_any_call("queue:exploration", "agent-1")
+        assert await fake_redis.zcard("queue:notifications") == 0
+        assert await fake_redis.zrange("queue:exploration", 0, -1) == ["agent-2"]
 
     @pytest.mark.asyncio
-    async def test_get_queue_lengths(
-        self,
-        queue: PriorityQueue,
-        mock_redis: AsyncMock,
-    ) -> None:
+    async def test_get_queue_lengths(self, queue: PriorityQueue) -> None:
         """Test getting queue lengths."""
-        mock_redis.zcard.side_effect = [10, 5]
+        for i in range(3):
+            await queue.add_notification(f"notif-{i}", i)
+        await queue.add_exploration("explore-1", None)
 
         notif_len, explore_len = await queue.get_queue_lengths()
 
-        assert notif_len == 10
-        assert explore_len == 5
-        mock_redis.zcard.assert_any_call("queue:notifications")
-        mock_redis.zcard.assert_any_call("queue:exploration")
+        assert notif_len == 3
+        assert explore_len == 1
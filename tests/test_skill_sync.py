@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest import mock
 
 import pytest
 
-from botburrow_agents.jobs.skill_sync import BLOCKED_PATTERNS, MAX_SKILL_SIZE_BYTES, SkillSync
+from botburrow_agents.jobs.skill_sync import (
+    BLOCKED_PATTERNS,
+    MAX_CONCURRENT_SOURCES,
+    MAX_SKILL_SIZE_BYTES,
+    SkillSync,
+)
 
 
 @pytest.fixture
@@ -36,8 +42,7 @@ def skill_sync(mock_settings):
 class TestSkillValidation:
     """Tests for skill security validation."""
 
-    @pytest.mark.asyncio
-    async def test_validate_skill_accepts_valid_skill(self, skill_sync):
+    def test_validate_skill_accepts_valid_skill(self, skill_sync):
         """Test that a valid skill is accepted."""
         content = """---
 title: Test Skill
@@ -48,32 +53,43 @@ description: A test skill
 
 This is a valid skill.
 """
-        result = await skill_sync._validate_skill("test_skill.md", content)
+        result = skill_sync._validate_skill("test_skill.md", content)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_validate_skill_rejects_too_large(self, skill_sync):
+    def test_validate_skill_rejects_too_large(self, skill_sync):
         """Test that oversized skills are rejected."""
         # Create content larger than MAX_SKILL_SIZE_BYTES
         content = "x" * (MAX_SKILL_SIZE_BYTES + 1)
-        result = await skill_sync._validate_skill("large.md", content)
+        result = skill_sync._validate_skill("large.md", content)
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_validate_skill_rejects_blocked_patterns(self, skill_sync):
+    def test_validate_skill_rejects_too_large_multibyte(self, skill_sync):
+        """Test that size is measured in UTF-8 bytes, not characters."""
+        # Fewer characters than the limit, but more bytes once encoded
+        content = "\u00e9" * (MAX_SKILL_SIZE_BYTES // 2 + 1)
+        result = skill_sync._validate_skill("large.md", content)
+        assert result is False
+
+    def test_validate_skill_rejects_blocked_patterns(self, skill_sync):
         """Test that skills with blocked patterns are rejected."""
         for pattern in BLOCKED_PATTERNS:
             content = f"# Bad Skill\n\nSome code with {pattern}"
-            result = await skill_sync._validate_skill("bad.md", content)
+            result = skill_sync._validate_skill("bad.md", content)
             assert result is False, f"Should block pattern: {pattern}"
 
-    @pytest.mark.asyncio
-    async def test_validate_skill_accepts_no_frontmatter(self, skill_sync):
+    def test_validate_skill_rejects_blocked_patterns_any_case(self, skill_sync):
+        """Test that blocked patterns are matched case-insensitively."""
+        for pattern in BLOCKED_PATTERNS:
+            content = f"# Bad Skill\n\nSome code with {pattern.upper()}"
+            result = skill_sync._validate_skill("bad.md", content)
+            assert result is False, f"Should block pattern: {pattern.upper()}"
+
+    def test_validate_skill_accepts_no_frontmatter(self, skill_sync):
         """Test that skills without frontmatter are accepted (for .py files)."""
         content = """def hello():
     print("hello")
 """
-        result = await skill_sync._validate_skill("hello.py", content)
+        result = skill_sync._validate_skill("hello.py", content)
         assert result is True
 
 
@@ -136,11 +152,18 @@ Content
         assert result["name"] == "bad"
         assert "synced_at" in result
 
+    def test_parse_frontmatter_empty_block(self, skill_sync):
+        """Test an empty frontmatter block adds no catalog fields."""
+        result = skill_sync._parse_skill_frontmatter("---\n---\nbody", "empty.md")
 
+        assert result["name"] == "empty"
+        assert "title" not in result
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestSyncOnce:
     """Tests for the full sync iteration."""
 
-    @pytest.mark.asyncio
     async def test_sync_once_aggregates_stats(self, skill_sync):
         """Test that sync_once aggregates stats from all sources."""
 
@@ -165,7 +188,6 @@ class TestSyncOnce:
         assert stats["uploaded"] == 3
         assert stats["failed"] == 0
 
-    @pytest.mark.asyncio
     async def test_sync_once_handles_errors_gracefully(self, skill_sync):
         """Test that sync_once continues after source errors."""
 
@@ -191,7 +213,27 @@ class TestSyncOnce:
         assert stats["uploaded"] == 1
         assert len(stats["errors"]) == 1
 
-    @pytest.mark.asyncio
+    async def test_sync_once_fetches_sources_concurrently(self, skill_sync):
+        """Test that sources are synced concurrently up to the limit."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_sync_source(_source):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"fetched": 1, "errors": []}
+
+        skill_sync._sync_source = mock_sync_source
+        skill_sync.sources = [f"owner/repo{i}" for i in range(MAX_CONCURRENT_SOURCES + 2)]
+
+        stats = await skill_sync.sync_once()
+
+        assert stats["fetched"] == MAX_CONCURRENT_SOURCES + 2
+        assert peak == MAX_CONCURRENT_SOURCES
+
     async def test_sync_once_with_custom_sources(self, skill_sync):
         """Test sync_once with custom source list."""
 
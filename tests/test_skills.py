@@ -1,10 +1,21 @@
 """Tests for skill loader."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from botburrow_agents.skills.loader import Skill, SkillLoader
 
 
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """Start every test with an empty shared parse cache."""
+    SkillLoader._parse_cache.clear()
+    yield
+    SkillLoader._parse_cache.clear()
+
+
 class TestSkillLoader:
     """Tests for SkillLoader class."""
 
@@ -25,7 +36,7 @@ class TestSkillLoader:
     @pytest.mark.asyncio
     async def test_load_skill_from_r2(self, loader, mock_git_client):
         """Test loading skill from Git."""
-        mock_git_client.get_skill.return_value = """---
+        mock_git_client.get_skill_bytes.return_value = b"""---
 name: github-pr
 description: Create GitHub PRs
 version: 1.0.0
@@ -46,10 +57,45 @@ Instructions for creating PRs...
         assert "github:write" in skill.requires_grants
         assert "Instructions" in skill.instructions
 
+    @pytest.mark.asyncio
+    async def test_load_skill_parses_identical_content_once(self, loader, mock_git_client):
+        """Test identical skill content is parsed once and then served from cache."""
+        mock_git_client.get_skill_bytes.return_value = b"""---
+name: cached-skill
+description: Parsed once
+---
+
+# Cached Skill
+"""
+
+        with patch.object(loader, "_parse_skill", wraps=loader._parse_skill) as parse:
+            first = await loader.load_skill("cached-skill")
+            second = await loader.load_skill("cached-skill")
+
+        assert parse.call_count == 1
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_load_skill_copies_share_prompt_fragment(self, loader, mock_git_client):
+        """Test cached copies reuse the fragment rendered on the cache entry."""
+        mock_git_client.get_skill_bytes.return_value = b"---\nname: shared\n---\n\nBody"
+
+        first = await loader.load_skill("shared")
+        second = await loader.load_skill("shared")
+
+        assert first._prompt_key is not None
+        assert first.prompt_fragment is second.prompt_fragment
+
+        first.instructions = "Changed"
+
+        assert "Changed" in first.prompt_fragment
+        assert "Changed" not in second.prompt_fragment
+
     @pytest.mark.asyncio
     async def test_load_skill_not_found(self, loader, mock_git_client):
         """Test loading nonexistent skill returns None."""
-        mock_git_client.get_skill.side_effect = FileNotFoundError()
+        mock_git_client.get_skill_bytes.side_effect = FileNotFoundError()
 
         skill = await loader.load_skill("nonexistent-skill")
 
@@ -92,6 +138,25 @@ This is the instruction content.
         assert "test" in skill.triggers_keywords
         assert "Test Skill" in skill.instructions
 
+    def test_parse_skill_set_fields(self, loader):
+        """Test tag and requirement fields are frozensets, even from a lone string."""
+        content = """---
+name: set-skill
+tags: solo
+requires_grants:
+  - github:read
+  - github:read
+---
+
+Body
+"""
+
+        skill = loader._parse_skill("set-skill", content)
+
+        assert skill.tags == frozenset({"solo"})
+        assert skill.requires_grants == frozenset({"github:read"})
+        assert skill.requires_cli == frozenset()
+
     def test_parse_skill_without_frontmatter(self, loader):
         """Test parsing skill without frontmatter."""
         content = """# Simple Skill
@@ -149,6 +214,17 @@ Just instructions, no metadata.
         assert "Do thing 1" in prompt
         assert "skill-2" in prompt
 
+    def test_prompt_fragment_follows_field_changes(self, loader):
+        """Test the cached prompt fragment is re-rendered when fields change."""
+        skill = Skill(name="skill-1", description="First skill", instructions="Old")
+        assert "Old" in loader.skills_to_prompt([skill])
+
+        skill.instructions = "New"
+
+        prompt = loader.skills_to_prompt([skill])
+        assert "New" in prompt
+        assert "Old" not in prompt
+
     def test_empty_skills_to_prompt(self, loader):
         """Test empty skills returns empty prompt."""
         prompt = loader.skills_to_prompt([])
@@ -179,6 +255,20 @@ Instructions here
         assert skill is not None
         assert skill.name == "test"
 
+    def test_parse_skill_non_mapping_frontmatter(self, loader):
+        """Test frontmatter that parses to a list is ignored, not an error."""
+        content = """---
+- just
+- a list
+---
+
+Instructions here
+"""
+
+        skill = loader._parse_skill("listy", content)
+        assert skill.name == "listy"
+        assert skill.instructions == "Instructions here"
+
     def test_parse_skill_empty_frontmatter(self, loader):
         """Test parsing skill with empty frontmatter."""
         content = """---
@@ -192,6 +282,14 @@ Instructions here
         assert (
             "Instructions here" in skill.instructions or skill.instructions == "Instructions here"
         )
+        assert skill.description == "Skill: test"
+
+    def test_parse_skill_frontmatter_only(self, loader):
+        """Test a closing delimiter at end of file still ends the frontmatter."""
+        skill = loader._parse_skill("test", "---\nname: meta-only\n---")
+
+        assert skill.name == "meta-only"
+        assert skill.instructions == ""
 
     def test_has_required_grants_wildcard(self, loader, agent_config):
         """Test grant checking with wildcard."""
@@ -247,6 +345,23 @@ Instructions here
         # Should fail - agent has no aws grants at all
         assert loader._has_required_grants(agent, skill) is False
 
+    def test_has_required_grants_bare_service_name(self, loader):
+        """Test a grant without a scope does not cover scoped requirements."""
+        from botburrow_agents.models import AgentConfig, CapabilityGrants
+
+        agent = AgentConfig(
+            name="test",
+            capabilities=CapabilityGrants(grants=["github"]),
+        )
+
+        skill = Skill(
+            name="github-skill",
+            description="Needs GitHub",
+            requires_grants=["github:read"],
+        )
+
+        assert loader._has_required_grants(agent, skill) is False
+
     @pytest.mark.asyncio
     async def test_load_skills_filters_by_grants(
         self,
@@ -291,7 +406,7 @@ Instructions here
         mock_git_client.list_skills.return_value = ["github-pr"]
 
         # Mock the skill content
-        mock_git_client.get_skill.return_value = """---
+        mock_git_client.get_skill_bytes.return_value = b"""---
 name: github-pr
 description: GitHub PR skill
 triggers:
@@ -312,6 +427,64 @@ Handle PR-related tasks.
         assert len(skills) == 1
         assert skills[0].name == "github-pr"
 
+    def test_matches_triggers_case_insensitive_substring(self, loader):
+        """Test trigger keywords match case-insensitively anywhere in the content."""
+        skill = Skill(name="deploy", description="Deploys", triggers_keywords=["Deploy"])
+
+        assert loader._matches_triggers(skill, "please redeploy the service")
+        assert not loader._matches_triggers(skill, "please review the service")
+
+    @pytest.mark.asyncio
+    async def test_load_skill_copies_share_triggers_lower(self, loader, mock_git_client):
+        """Test cached copies reuse the triggers lowercased on the cache entry."""
+        mock_git_client.get_skill_bytes.return_value = (
+            b"---\nname: deploy\ntriggers:\n  keywords:\n    - Deploy\n---\n\nBody"
+        )
+
+        first = await loader.load_skill("deploy")
+        second = await loader.load_skill("deploy")
+
+        assert first._triggers_key is not None
+        assert first.triggers_lower is second.triggers_lower
+        assert first.triggers_lower == ("deploy",)
+
+    def test_matches_triggers_follows_keyword_changes(self, loader):
+        """Test reassigning trigger keywords takes effect on the next match."""
+        skill = Skill(name="deploy", description="Deploys", triggers_keywords=["Deploy"])
+        assert loader._matches_triggers(skill, "deploy now")
+
+        skill.triggers_keywords = ("Review",)
+
+        assert loader._matches_triggers(skill, "please review")
+        assert not loader._matches_triggers(skill, "deploy now")
+
+    @pytest.mark.asyncio
+    async def test_load_contextual_skills_checks_frontmatter_first(self, loader, mock_git_client):
+        """Test skills whose triggers don't match are never fetched in full."""
+        from botburrow_agents.models import AgentConfig, CapabilityGrants
+
+        agent = AgentConfig(
+            name="test",
+            capabilities=CapabilityGrants(grants=["github:read"]),
+        )
+        mock_git_client.list_skills.return_value = ["deploy"]
+        mock_git_client.get_skill_head.return_value = """---
+name: deploy
+triggers:
+  keywords:
+    - deploy
+---
+
+# Deploy
+"""
+
+        skills = await loader.load_contextual_skills(agent, "Please help with this pull request")
+
+        assert skills == []
+        mock_git_client.get_skill_bytes.assert_not_awaited()
+        # Head-only probes never enter the shared parse cache
+        assert not SkillLoader._parse_cache
+
     @pytest.mark.asyncio
     async def test_load_contextual_skills_no_match(self, loader, mock_git_client):
         """Test contextual skills with no matching keywords."""
@@ -328,6 +501,33 @@ Handle PR-related tasks.
 
         assert len(skills) == 0
 
+    @pytest.mark.asyncio
+    async def test_load_skills_fetches_concurrently_in_order(
+        self, loader, mock_git_client, agent_config
+    ):
+        """Test Git skills are fetched concurrently but returned in config order."""
+        from botburrow_agents.models import CapabilityGrants
+
+        names = [f"skill-{i}" for i in range(SkillLoader.FETCH_CONCURRENCY + 4)]
+        agent_config.capabilities = CapabilityGrants(skills=names)
+        in_flight = 0
+        peak = 0
+
+        async def get_skill_bytes(name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"---\nname: {name}\n---\n\nBody".encode()
+
+        mock_git_client.get_skill_bytes.side_effect = get_skill_bytes
+
+        skills = await loader.load_skills(agent_config)
+
+        assert [s.name for s in skills] == names
+        assert peak == SkillLoader.FETCH_CONCURRENCY
+
     @pytest.mark.asyncio
     async def test_load_skills_logs_on_failure(
         self,
@@ -347,7 +547,7 @@ Handle PR-related tasks.
         )
 
         # Mock to raise exception
-        mock_git_client.get_skill.side_effect = Exception("Git error")
+        mock_git_client.get_skill_bytes.side_effect = Exception("Git error")
 
         # Should not raise, just log
         skills = await loader.load_skills(agent_config)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import json
 import time
-from unittest.mock import AsyncMock
+from dataclasses import FrozenInstanceError
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -32,24 +33,15 @@ def work_queue_settings() -> Settings:
 
 
 @pytest.fixture
-def mock_redis() -> AsyncMock:
-    """Mock RedisClient."""
-    mock = AsyncMock()
-    mock._ensure_connected = AsyncMock(return_value=mock)
-    mock.lpush = AsyncMock()
-    mock.brpop = AsyncMock()
-    mock.hget = AsyncMock()
-    mock.hset = AsyncMock()
-    mock.hdel = AsyncMock()
-    mock.hincrby = AsyncMock()
-    mock.hlen = AsyncMock()
-    mock.llen = AsyncMock()
-    mock.set = AsyncMock()
-    mock.get = AsyncMock()
-    mock.delete = AsyncMock()
-    mock.expire = AsyncMock()
-    mock.eval = AsyncMock()
-    return mock
+def redis_client(fake_redis) -> AsyncMock:
+    """RedisClient stand-in handing out a fakeredis connection.
+
+    fakeredis runs real command semantics in-process, so the Lua scripts
+    and pipelines in work_queue execute for real.
+    """
+    client = AsyncMock()
+    client._ensure_connected = AsyncMock(return_value=fake_redis)
+    return client
 
 
 class TestWorkItem:
@@ -96,20 +88,38 @@ class TestWorkItem:
         assert item.inbox_count == 0
         assert item.created_at == 1234567890.0
 
+    def test_json_round_trip(self) -> None:
+        """Test to_json output reads back into an equal item."""
+        item = WorkItem(
+            agent_id="agent-1",
+            agent_name="Agent 1",
+            task_type=TaskType.DISCOVERY,
+            priority="low",
+            inbox_count=3,
+        )
+
+        assert WorkItem.from_json(item.to_json()) == item
+
+    def test_work_item_is_frozen(self) -> None:
+        """Test work items cannot be mutated once queued."""
+        item = WorkItem(agent_id="agent-1", agent_name="Agent 1", task_type=TaskType.INBOX)
 
+        with pytest.raises(FrozenInstanceError):
+            item.priority = "high"  # type: ignore[misc]
+
+
+@pytest.mark.requires_lua
 class TestWorkQueueEnqueue:
     """Tests for WorkQueue enqueue functionality."""
 
     @pytest.fixture
-    def queue(self, mock_redis: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
-        """Create WorkQueue with mock."""
-        return WorkQueue(mock_redis, work_queue_settings)
+    def queue(self, redis_client: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
+        """Create WorkQueue backed by fakeredis."""
+        return WorkQueue(redis_client, work_queue_settings)
 
     @pytest.mark.asyncio
-    async def test_enqueue_success(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_enqueue_success(self, queue: WorkQueue, fake_redis) -> None:
         """Test successful enqueue."""
-        mock_redis.hget.return_value = None  # No active task
-
         item = WorkItem(
             agent_id="agent-1",
             agent_name="Agent 1",
@@ -119,12 +129,13 @@ class TestWorkQueueEnqueue:
         result = await queue.enqueue(item)
 
         assert result is True
-        mock_redis.lpush.assert_called_once()
+        queued = await fake_redis.lrange("work:queue:normal", 0, -1)
+        assert [WorkItem.from_json(q).agent_id for q in queued] == ["agent-1"]
 
     @pytest.mark.asyncio
-    async def test_enqueue_skip_duplicate(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_enqueue_skip_duplicate(self, queue: WorkQueue, fake_redis) -> None:
         """Test skipping duplicate work item."""
-        mock_redis.hget.return_value = "runner-1"  # Already active
+        await fake_redis.hset(ACTIVE_TASKS, "agent-1", "runner-1")  # Already active
 
         item = WorkItem(
             agent_id="agent-1",
@@ -135,15 +146,12 @@ class TestWorkQueueEnqueue:
         result = await queue.enqueue(item)
 
         assert result is False
-        mock_redis.lpush.assert_not_called()
+        assert await fake_redis.llen("work:queue:normal") == 0
 
     @pytest.mark.asyncio
-    async def test_enqueue_skip_backoff(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_enqueue_skip_backoff(self, queue: WorkQueue, fake_redis) -> None:
         """Test skipping agent in backoff."""
-        mock_redis.hget.side_effect = [
-            None,  # No active task
-            str(time.time() + 3600),  # Backoff until future
-        ]
+        await fake_redis.hset(AGENT_BACKOFF, "agent-1", str(time.time() + 3600))
 
         item = WorkItem(
             agent_id="agent-1",
@@ -154,17 +162,12 @@ class TestWorkQueueEnqueue:
         result = await queue.enqueue(item)
 
         assert result is False
-        mock_redis.lpush.assert_not_called()
+        assert await fake_redis.llen("work:queue:normal") == 0
 
     @pytest.mark.asyncio
-    async def test_enqueue_clear_expired_backoff(
-        self, queue: WorkQueue, mock_redis: AsyncMock
-    ) -> None:
+    async def test_enqueue_clear_expired_backoff(self, queue: WorkQueue, fake_redis) -> None:
         """Test clearing expired backoff."""
-        mock_redis.hget.side_effect = [
-            None,  # No active task
-            str(time.time() - 100),  # Backoff expired
-        ]
+        await fake_redis.hset(AGENT_BACKOFF, "agent-1", str(time.time() - 100))
 
         item = WorkItem(
             agent_id="agent-1",
@@ -175,13 +178,13 @@ class TestWorkQueueEnqueue:
         result = await queue.enqueue(item)
 
         assert result is True
-        mock_redis.hdel.assert_called_once_with(AGENT_BACKOFF, "agent-1")
-        mock_redis.lpush.assert_called_once()
+        assert await fake_redis.hget(AGENT_BACKOFF, "agent-1") is None
+        assert await fake_redis.llen("work:queue:normal") == 1
 
     @pytest.mark.asyncio
-    async def test_enqueue_force_skip_dedup(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_enqueue_force_skip_dedup(self, queue: WorkQueue, fake_redis) -> None:
         """Test force flag bypasses deduplication."""
-        mock_redis.hget.return_value = "runner-1"  # Already active
+        await fake_redis.hset(ACTIVE_TASKS, "agent-1", "runner-1")  # Already active
 
         item = WorkItem(
             agent_id="agent-1",
@@ -192,19 +195,16 @@ class TestWorkQueueEnqueue:
         result = await queue.enqueue(item, force=True)
 
         assert result is True
-        mock_redis.lpush.assert_called_once()
+        assert await fake_redis.llen("work:queue:normal") == 1
 
     @pytest.mark.asyncio
-    async def test_enqueue_priority_queues(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_enqueue_priority_queues(self, queue: WorkQueue, fake_redis) -> None:
         """Test items go to correct priority queue."""
-        mock_redis.hget.return_value = None
-
         for priority, expected_queue in [
             ("high", "work:queue:high"),
             ("normal", "work:queue:normal"),
             ("low", "work:queue:low"),
         ]:
-            mock_redis.lpush.reset_mock()
             item = WorkItem(
                 agent_id=f"agent-{priority}",
                 agent_name=f"Agent {priority}",
@@ -214,20 +214,20 @@ class TestWorkQueueEnqueue:
 
             await queue.enqueue(item)
 
-            call_args = mock_redis.lpush.call_args[0]
-            assert call_args[0] == expected_queue
+            queued = await fake_redis.lrange(expected_queue, 0, -1)
+            assert [WorkItem.from_json(q).agent_id for q in queued] == [f"agent-{priority}"]
 
 
 class TestWorkQueueClaim:
     """Tests for WorkQueue claim functionality."""
 
     @pytest.fixture
-    def queue(self, mock_redis: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
-        """Create WorkQueue with mock."""
-        return WorkQueue(mock_redis, work_queue_settings)
+    def queue(self, redis_client: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
+        """Create WorkQueue backed by fakeredis."""
+        return WorkQueue(redis_client, work_queue_settings)
 
     @pytest.mark.asyncio
-    async def test_claim_success(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_claim_success(self, queue: WorkQueue, fake_redis) -> None:
         """Test successful claim."""
         work_data = {
             "agent_id": "agent-1",
@@ -235,38 +235,63 @@ class TestWorkQueueClaim:
             "task_type": "inbox",
             "priority": "normal",
         }
-        mock_redis.brpop.return_value = (
-            "work:queue:normal",
-            json.dumps(work_data),
-        )
+        await fake_redis.lpush("work:queue:normal", json.dumps(work_data))
 
-        result = await queue.claim("runner-1", timeout=30)
+        with patch.object(fake_redis, "brpop", wraps=fake_redis.brpop) as brpop:
+            result = await queue.claim("runner-1", timeout=30)
 
         assert result is not None
         assert result.agent_id == "agent-1"
-        mock_redis.hset.assert_called_once_with(ACTIVE_TASKS, "agent-1", "runner-1")
+        # One blocking pop across all queues, highest priority first
+        brpop.assert_called_once_with(
+            ["work:queue:high", "work:queue:normal", "work:queue:low"],
+            timeout=30,
+        )
+        assert await fake_redis.hget(ACTIVE_TASKS, "agent-1") == "runner-1"
+        assert await fake_redis.llen("work:queue:normal") == 0
 
     @pytest.mark.asyncio
-    async def test_claim_timeout(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
-        """Test claim returns None on timeout."""
-        mock_redis.brpop.return_value = None
+    async def test_claim_prefers_higher_priority(self, queue: WorkQueue, fake_redis) -> None:
+        """Test claim drains the high queue before lower ones."""
+        for priority in ("low", "high", "normal"):
+            item = WorkItem(
+                agent_id=f"agent-{priority}",
+                agent_name=f"Agent {priority}",
+                task_type=TaskType.INBOX,
+                priority=priority,
+            )
+            await fake_redis.lpush(f"work:queue:{priority}", item.to_json())
+
+        claimed = [await queue.claim("runner-1", timeout=1) for _ in range(3)]
 
-        result = await queue.claim("runner-1", timeout=30)
+        assert [w.agent_id for w in claimed if w] == ["agent-high", "agent-normal", "agent-low"]
+
+    @pytest.mark.asyncio
+    async def test_claim_timeout(self, queue: WorkQueue, fake_redis) -> None:
+        """Test claim returns None on timeout."""
+        # BRPOP answers None when its timeout expires; skip the real wait
+        with patch.object(fake_redis, "brpop", AsyncMock(return_value=None)) as brpop:
+            result = await queue.claim("runner-1", timeout=1)
 
         assert result is None
+        assert brpop.await_args.kwargs["timeout"] == 1
 
 
 class TestWorkQueueComplete:
     """Tests for WorkQueue complete functionality."""
 
     @pytest.fixture
-    def queue(self, mock_redis: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
-        """Create WorkQueue with mock."""
-        return WorkQueue(mock_redis, work_queue_settings)
+    def queue(self, redis_client: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
+        """Create WorkQueue backed by fakeredis."""
+        return WorkQueue(redis_client, work_queue_settings)
 
     @pytest.mark.asyncio
-    async def test_complete_success(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_complete_success(self, queue: WorkQueue, fake_redis) -> None:
         """Test completing work successfully."""
+        await fake_redis.hset(ACTIVE_TASKS, "agent-1", "runner-1")
+        await fake_redis.hset(AGENT_FAILURES, "agent-1", 2)
+        await fake_redis.hset(AGENT_BACKOFF, "agent-1", str(time.time() - 100))
+
         item = WorkItem(
             agent_id="agent-1",
             agent_name="Agent 1",
@@ -275,16 +300,15 @@ class TestWorkQueueComplete:
 
         await queue.complete(item, success=True)
 
-        mock_redis.hdel.assert_any_call(ACTIVE_TASKS, "agent-1")
-        mock_redis.hdel.assert_any_call(AGENT_FAILURES, "agent-1")
-        mock_redis.hdel.assert_any_call(AGENT_BACKOFF, "agent-1")
+        assert await fake_redis.hget(ACTIVE_TASKS, "agent-1") is None
+        assert await fake_redis.hget(AGENT_FAILURES, "agent-1") is None
+        assert await fake_redis.hget(AGENT_BACKOFF, "agent-1") is None
 
     @pytest.mark.asyncio
-    async def test_complete_failure_increments_count(
-        self, queue: WorkQueue, mock_redis: AsyncMock
-    ) -> None:
+    async def test_complete_failure_increments_count(self, queue: WorkQueue, fake_redis) -> None:
         """Test completing with failure increments count."""
-        mock_redis.hincrby.return_value = 2  # 2nd failure
+        await fake_redis.hset(ACTIVE_TASKS, "agent-1", "runner-1")
+        await fake_redis.hset(AGENT_FAILURES, "agent-1", 1)
 
         item = WorkItem(
             agent_id="agent-1",
@@ -294,17 +318,17 @@ class TestWorkQueueComplete:
 
         await queue.complete(item, success=False)
 
-        mock_redis.hdel.assert_called_once_with(ACTIVE_TASKS, "agent-1")
-        mock_redis.hincrby.assert_called_once_with(AGENT_FAILURES, "agent-1", 1)
+        assert await fake_redis.hget(ACTIVE_TASKS, "agent-1") is None
+        assert await fake_redis.hget(AGENT_FAILURES, "agent-1") == "2"
         # Should not trigger circuit breaker yet
-        mock_redis.hset.assert_not_called()
+        assert await fake_redis.hget(AGENT_BACKOFF, "agent-1") is None
 
     @pytest.mark.asyncio
     async def test_complete_failure_triggers_circuit_breaker(
-        self, queue: WorkQueue, mock_redis: AsyncMock
+        self, queue: WorkQueue, fake_redis
     ) -> None:
         """Test that repeated failures trigger circuit breaker."""
-        mock_redis.hincrby.return_value = 5  # 5th failure = threshold
+        await fake_redis.hset(AGENT_FAILURES, "agent-1", 4)  # 5th failure = threshold
 
         item = WorkItem(
             agent_id="agent-1",
@@ -312,28 +336,31 @@ class TestWorkQueueComplete:
             task_type=TaskType.INBOX,
         )
 
+        before = time.time()
         await queue.complete(item, success=False)
 
         # Should set backoff
-        mock_redis.hset.assert_called_once()
-        call_args = mock_redis.hset.call_args[0]
-        assert call_args[0] == AGENT_BACKOFF
-        assert call_args[1] == "agent-1"
+        backoff_until = await fake_redis.hget(AGENT_BACKOFF, "agent-1")
+        assert backoff_until is not None
+        assert float(backoff_until) > before
 
 
 class TestWorkQueueStats:
     """Tests for WorkQueue statistics."""
 
     @pytest.fixture
-    def queue(self, mock_redis: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
-        """Create WorkQueue with mock."""
-        return WorkQueue(mock_redis, work_queue_settings)
+    def queue(self, redis_client: AsyncMock, work_queue_settings: Settings) -> WorkQueue:
+        """Create WorkQueue backed by fakeredis."""
+        return WorkQueue(redis_client, work_queue_settings)
 
     @pytest.mark.asyncio
-    async def test_get_queue_stats(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_get_queue_stats(self, queue: WorkQueue, fake_redis) -> None:
         """Test getting queue statistics."""
-        mock_redis.llen.side_effect = [10, 20, 5]  # high, normal, low
-        mock_redis.hlen.side_effect = [3, 2]  # active, backoff
+        await fake_redis.lpush("work:queue:high", *["h"] * 10)
+        await fake_redis.lpush("work:queue:normal", *["n"] * 20)
+        await fake_redis.lpush("work:queue:low", *["l"] * 5)
+        await fake_redis.hset(ACTIVE_TASKS, mapping={"a1": "r1", "a2": "r2", "a3": "r3"})
+        await fake_redis.hset(AGENT_BACKOFF, mapping={"a4": "1", "a5": "1"})
 
         stats = await queue.get_queue_stats()
 
@@ -345,136 +372,171 @@ class TestWorkQueueStats:
         assert stats["agents_in_backoff"] == 2
 
     @pytest.mark.asyncio
-    async def test_clear_backoff(self, queue: WorkQueue, mock_redis: AsyncMock) -> None:
+    async def test_clear_backoff(self, queue: WorkQueue, fake_redis) -> None:
         """Test clearing agent backoff."""
+        await fake_redis.hset(AGENT_BACKOFF, "agent-1", str(time.time() + 3600))
+        await fake_redis.hset(AGENT_FAILURES, "agent-1", 5)
+
         await queue.clear_backoff("agent-1")
 
-        mock_redis.hdel.assert_any_call(AGENT_BACKOFF, "agent-1")
-        mock_redis.hdel.assert_any_call(AGENT_FAILURES, "agent-1")
+        assert await fake_redis.hget(AGENT_BACKOFF, "agent-1") is None
+        assert await fake_redis.hget(AGENT_FAILURES, "agent-1") is None
 
 
 class TestConfigCache:
     """Tests for ConfigCache."""
 
     @pytest.fixture
-    def cache(self, mock_redis: AsyncMock) -> ConfigCache:
-        """Create ConfigCache with mock."""
-        return ConfigCache(mock_redis, ttl=300)
+    def cache(self, redis_client: AsyncMock) -> ConfigCache:
+        """Create ConfigCache backed by fakeredis."""
+        return ConfigCache(redis_client, ttl=300)
 
     @pytest.mark.asyncio
-    async def test_get_cached(self, cache: ConfigCache, mock_redis: AsyncMock) -> None:
+    async def test_get_cached(self, cache: ConfigCache, fake_redis) -> None:
         """Test getting cached config."""
         config = {"name": "Agent 1", "type": "claude-code"}
-        mock_redis.get.return_value = json.dumps(config)
+        await fake_redis.set("cache:agent:agent-1", json.dumps(config))
 
         result = await cache.get("agent-1")
 
         assert result == config
-        mock_redis.get.assert_called_once_with("cache:agent:agent-1")
 
     @pytest.mark.asyncio
-    async def test_get_not_cached(self, cache: ConfigCache, mock_redis: AsyncMock) -> None:
+    async def test_get_not_cached(self, cache: ConfigCache) -> None:
         """Test getting config when not cached."""
-        mock_redis.get.return_value = None
-
         result = await cache.get("agent-1")
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_set(self, cache: ConfigCache, mock_redis: AsyncMock) -> None:
+    async def test_set(self, cache: ConfigCache, fake_redis) -> None:
         """Test setting cached config."""
         config = {"name": "Agent 1", "type": "claude-code"}
 
         await cache.set("agent-1", config)
 
-        mock_redis.set.assert_called_once_with(
-            "cache:agent:agent-1",
-            json.dumps(config),
-            ex=300,
-        )
+        assert json.loads(await fake_redis.get("cache:agent:agent-1")) == config
+        assert 0 < await fake_redis.ttl("cache:agent:agent-1") <= 300
+        # Written through to the local copy as well
+        await fake_redis.delete("cache:agent:agent-1")
+        assert await cache.get("agent-1") == config
 
     @pytest.mark.asyncio
-    async def test_invalidate(self, cache: ConfigCache, mock_redis: AsyncMock) -> None:
+    async def test_invalidate(self, cache: ConfigCache, fake_redis) -> None:
         """Test invalidating cached config."""
+        await cache.set("agent-1", {"name": "Agent 1"})
+
         await cache.invalidate("agent-1")
 
-        mock_redis.delete.assert_called_once_with("cache:agent:agent-1")
+        assert await fake_redis.get("cache:agent:agent-1") is None
+        assert await cache.get("agent-1") is None
+
+    @pytest.mark.asyncio
+    async def test_get_served_locally_after_first_hit(self, cache: ConfigCache, fake_redis) -> None:
+        """Test repeated gets skip Redis while the local copy is fresh."""
+        config = {"name": "Agent 1", "type": "claude-code"}
+        await fake_redis.set("cache:agent:agent-1", json.dumps(config))
+
+        assert await cache.get("agent-1") == config
+        await fake_redis.delete("cache:agent:agent-1")  # Only the local copy is left
+
+        assert await cache.get("agent-1") == config
+
+    @pytest.mark.asyncio
+    async def test_local_copy_expires(
+        self, cache: ConfigCache, fake_redis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test stale local entries fall back to Redis."""
+        await fake_redis.set("cache:agent:agent-1", json.dumps({"name": "Agent 1"}))
+        await cache.get("agent-1")
+        await fake_redis.set("cache:agent:agent-1", json.dumps({"name": "Agent 1 v2"}))
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + ConfigCache.LOCAL_TTL + 1)
+
+        assert await cache.get("agent-1") == {"name": "Agent 1 v2"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_drops_local_copies(self, cache: ConfigCache, fake_redis) -> None:
+        """Test invalidate_all clears Redis and the local copies."""
+        await cache.set("agent-1", {"name": "Agent 1"})
+        await cache.set("agent-2", {"name": "Agent 2"})
+
+        await cache.invalidate_all()
+
+        assert await fake_redis.keys("cache:agent:*") == []
+        assert await cache.get("agent-1") is None
+        assert await cache.get("agent-2") is None
 
 
 class TestLeaderElection:
     """Tests for LeaderElection."""
 
     @pytest.fixture
-    def leader(self, mock_redis: AsyncMock) -> LeaderElection:
-        """Create LeaderElection with mock."""
-        return LeaderElection(mock_redis, "coordinator-1")
+    def leader(self, redis_client: AsyncMock) -> LeaderElection:
+        """Create LeaderElection backed by fakeredis."""
+        return LeaderElection(redis_client, "coordinator-1")
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
-    async def test_try_become_leader_success(
-        self, leader: LeaderElection, mock_redis: AsyncMock
-    ) -> None:
+    async def test_try_become_leader_success(self, leader: LeaderElection, fake_redis) -> None:
         """Test successfully becoming leader."""
-        mock_redis.set.return_value = True
-
         result = await leader.try_become_leader()
 
         assert result is True
         assert leader.is_leader is True
-        mock_redis.set.assert_called_once_with(
-            "coordinator:leader",
-            "coordinator-1",
-            nx=True,
-            ex=30,
-        )
+        assert await fake_redis.get("coordinator:leader") == "coordinator-1"
+        assert 0 < await fake_redis.ttl("coordinator:leader") <= 30
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
     async def test_try_become_leader_already_leader(
-        self, leader: LeaderElection, mock_redis: AsyncMock
+        self, leader: LeaderElection, fake_redis
     ) -> None:
         """Test refreshing leadership when already leader."""
-        mock_redis.set.return_value = False  # Can't acquire
-        mock_redis.get.return_value = "coordinator-1"  # We're already leader
+        await fake_redis.set("coordinator:leader", "coordinator-1", ex=5)  # We're already leader
 
         result = await leader.try_become_leader()
 
         assert result is True
         assert leader.is_leader is True
-        mock_redis.expire.assert_called_once_with("coordinator:leader", 30)
+        assert await fake_redis.ttl("coordinator:leader") > 5
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
-    async def test_try_become_leader_failure(
-        self, leader: LeaderElection, mock_redis: AsyncMock
-    ) -> None:
+    async def test_try_become_leader_failure(self, leader: LeaderElection, fake_redis) -> None:
         """Test failing to become leader."""
-        mock_redis.set.return_value = False  # Can't acquire
-        mock_redis.get.return_value = "coordinator-2"  # Someone else is leader
+        await fake_redis.set("coordinator:leader", "coordinator-2", ex=5)  # Someone else
 
         result = await leader.try_become_leader()
 
         assert result is False
         assert leader.is_leader is False
+        assert await fake_redis.get("coordinator:leader") == "coordinator-2"
+        assert await fake_redis.ttl("coordinator:leader") <= 5
 
+    @pytest.mark.requires_lua
     @pytest.mark.asyncio
-    async def test_release_leadership(self, leader: LeaderElection, mock_redis: AsyncMock) -> None:
+    async def test_release_leadership(self, leader: LeaderElection, fake_redis) -> None:
         """Test releasing leadership."""
         # First become leader
-        mock_redis.set.return_value = True
         await leader.try_become_leader()
 
         await leader.release_leadership()
 
         assert leader.is_leader is False
-        mock_redis.eval.assert_called_once()
+        assert await fake_redis.get("coordinator:leader") is None
 
     @pytest.mark.asyncio
     async def test_release_leadership_when_not_leader(
-        self, leader: LeaderElection, mock_redis: AsyncMock
+        self, leader: LeaderElection, fake_redis
     ) -> None:
         """Test releasing leadership when not leader does nothing."""
+        await fake_redis.set("coordinator:leader", "coordinator-2")
+
         await leader.release_leadership()
 
-        mock_redis.eval.assert_not_called()
+        assert await fake_redis.get("coordinator:leader") == "coordinator-2"
 
 
 class TestJitter: